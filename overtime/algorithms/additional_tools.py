@@ -35,7 +35,7 @@ def convert_to_directed(graph):
         converted_graph.add_node(node.label)
     # Add edges in both directions for each undirected edge
     for edge in graph.edges.aslist():
-        converted_graph.edges.add(edge.node1.label, edge.node2.label, graph.nodes, edge.start, edge.end)
-        converted_graph.edges.add(edge.node2.label, edge.node1.label, graph.nodes, edge.start, edge.end)
+        converted_graph.edges.add(edge.node1.label, edge.node2.label, converted_graph.nodes, edge.start, edge.end)
+        converted_graph.edges.add(edge.node2.label, edge.node1.label, converted_graph.nodes, edge.start, edge.end)
 
     return converted_graph
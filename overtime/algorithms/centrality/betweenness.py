@@ -49,19 +49,29 @@ def temporal_betweenness(graph, optimality="shortest", intervals=None, normalize
 
     labels = graph.nodes.labels()
 
+    # Nodes are handled by their integer ids (see NodeIds), labels are only used for the result
+    ids = graph.ids
+    n = ids.count()
+    nodes = [ids.get(label) for label in labels]
+
+    # Temporal neighbours of each node, by id, found once rather than on every visit
+    temporal_neighbours = [[] for _ in range(n)]
+    for node in graph.nodes.set:
+        temporal_neighbours[node.id] = [(ids.get(w), t_) for w, t_ in node.temporal_neighbours()]
+
     # Algorithm starts
-    shortest_centrality = {node: 0 for node in labels}
-    foremost_centrality = {node: 0 for node in labels}
+    shortest_centrality = [0] * n
+    foremost_centrality = [0] * n
 
-    for s in labels:
+    for s in nodes:
 
         # Initialize for nodes
-        dist_v = {node: -1 for node in labels}
-        sigma_v = {node: 0 for node in labels}
-        t_min_v = {node: -1 for node in labels}
+        dist_v = [-1] * n
+        sigma_v = [0] * n
+        t_min_v = [-1] * n
 
         # Initialize for node appearances
-        node_appearances = [(node, t) for node in labels for t in range(graph.edges.end())]
+        node_appearances = [(node, t) for node in nodes for t in range(graph.edges.end())]
 
         delta_v_t_shortest = {v_t: 0 for v_t in node_appearances}
         delta_v_t_foremost = {v_t: 0 for v_t in node_appearances}
@@ -84,7 +94,7 @@ def temporal_betweenness(graph, optimality="shortest", intervals=None, normalize
             v, t = Q.pop(0)
 
             # Iterate over temporal neighbours
-            for w, t_ in [neighbour for neighbour in graph.nodes.get(v).temporal_neighbours() if t < neighbour[1]]:
+            for w, t_ in [neighbour for neighbour in temporal_neighbours[v] if t < neighbour[1]]:
 
                 # For first visit to (w, t_)
                 if dist_v_t[(w, t_)] == -1:
@@ -105,8 +115,8 @@ def temporal_betweenness(graph, optimality="shortest", intervals=None, normalize
                     t_min_v[w] = t_
 
 
-        shortest_centrality[s] = shortest_centrality[s] - len([i for i in dist_v.values() if i >= 0]) + 1
-        foremost_centrality[s] = foremost_centrality[s] - len([i for i in dist_v.values() if i >= 0]) + 1
+        shortest_centrality[s] = shortest_centrality[s] - len([i for i in dist_v if i >= 0]) + 1
+        foremost_centrality[s] = foremost_centrality[s] - len([i for i in dist_v if i >= 0]) + 1
 
         while S:
 
@@ -129,6 +139,10 @@ def temporal_betweenness(graph, optimality="shortest", intervals=None, normalize
                 delta_v_t_foremost[(v, t)] += (sigma_v_t[(v, t)] / sigma_v_t[(w, t_)]) * delta_v_t_foremost[(w, t_)]
                 foremost_centrality[v] += (sigma_v_t[(v, t)] / sigma_v_t[(w, t_)]) * delta_v_t_foremost[(w, t_)]
 
+    # Map the node ids back to labels
+    shortest_centrality = {label: shortest_centrality[ids.get(label)] for label in labels}
+    foremost_centrality = {label: foremost_centrality[ids.get(label)] for label in labels}
+
     # Apply normalization
     if normalize:
         normalization_factor = ((graph.nodes.count() - 1) * (graph.nodes.count() - 2))
@@ -1,3 +1,5 @@
+import numpy as np
+
 import overtime as ot
 
 
@@ -91,28 +93,25 @@ def h_approximation(graph, h):
     """
 
     E_ = []
+    # the temporal reachability of every node, only the nodes that used a removed edge are calculated again.
+    reachabilities = ot.IncrementalReachability(graph)
 
     # find the node whose temporal reachability is more than h
     while (True):
-        root = ''
-        for node in graph.nodes.set:
-            reachability = ot.calculate_reachability(graph, node.label)
-            if reachability > h:
-                root = node.label
-                break
+        root = reachabilities.first_above(h)
 
         # check if the specified root actually exists in the graph.
-        if root == '':
+        if root is None:
             print('The temporal reachability of the input temporal graph is at most h')
             break
 
         # generate a reachable subtree based on the root
         subtree = reachable_subtree(graph, root, h)
 
-        E_.extend(subtree.edges.uids())
+        uids = subtree.edges.uids()
+        E_.extend(uids)
         # update (G, λ) ← (G, λ) \ E_
-        for edge in subtree.edges.uids():
-            graph.remove_edge(edge)
+        reachabilities.remove_edges(uids)
 
     return E_
 
@@ -134,9 +133,8 @@ def max_reachability(graph):
 
     maxReachability = 0
 
-    # check the temporal reachability of each node
-    for node in graph.nodes.labels():
-        r = ot.calculate_reachability(graph, node)
+    # check the temporal reachability of each node, calculated in one pass.
+    for r in ot.calculate_all_reachabilities(graph).values():
         if r > maxReachability:
             maxReachability = r
 
@@ -189,8 +187,8 @@ def find_edges(graph, layout, j):
 
     edgeList = []
     # divided the layout into two subsets based on j
-    layout1 = layout[:j + 1]
-    layout2 = layout[j + 1:len(layout)]
+    layout1 = set(layout[:j + 1])
+    layout2 = set(layout[j + 1:len(layout)])
 
     # find all edges with one endpoint in {v1...vj} and one endpoint in {vj+1...vn}
     for edge in graph.edges.set:
@@ -201,6 +199,52 @@ def find_edges(graph, layout, j):
     return edgeList
 
 
+def max_prefix_reachability(graph, layout, j):
+    """
+        A method to calculate the max temporal reachability of the subgraph on the layout prefix v1,...,vj.
+
+        Parameter(s):
+        -------------
+        graph : TemporalDiGraph
+            A directed, temporal graph.
+        layout : list
+            The vertices of graph can be arranged in a linear order
+            v1,...,vn, called a layout
+        j : int
+            An indicator which is used to separate the layout of graph into two list,
+            v1,...,vj and vj+1,...,vn
+
+        Returns:
+        --------
+        maxReachability : int
+            the max temporal reachability of the subgraph.
+
+        Notes:
+        ------
+        The same as the max_reachability of graph.get_temporal_subgraph(intervals=(0, max_endtime(graph)),
+        nodes=layout[:j + 1]), found from a selection of the graph's edge columns rather than a new graph.
+        The edges are ordered as that subgraph orders them (by start time, then by their source's place in the
+        layout), and results are kept in the graph's cache until the graph changes.
+
+    """
+
+    def calculate():
+        labels, sources, sinks, starts, ends = graph.cached('edge_columns', graph.edges.columns)
+        # place of each node id in the layout prefix, node ids outside of it are after it.
+        place = np.full(len(labels), len(layout), dtype=np.int64)
+        nodes = [label for label in dict.fromkeys(layout[:j + 1]) if graph.nodes.exists(label)]
+        place[[graph.nodes.get(label).id for label in nodes]] = np.arange(len(nodes))
+        # the edges between the nodes of the prefix, within the graph's timespan.
+        rows = np.flatnonzero(
+            (place[sources] < len(nodes)) & (place[sinks] < len(nodes)) & (starts >= 0) & (ends <= max_endtime(graph))
+        )
+        rows = rows[np.lexsort((rows, place[sources[rows]], starts[rows]))]
+        columns = (labels, sources[rows], sinks[rows], starts[rows], ends[rows])
+        return max(ot.count_reachable(columns, [graph.nodes.get(label).id for label in nodes]), default=0)
+
+    return graph.cached(('max_prefix_reachability', tuple(layout), j), calculate)
+
+
 def generate_Layout(graph):
     """
         A method to generate a layout of a network, such as {v1, v2, v3， ....， vn}.
@@ -256,14 +300,9 @@ def c_approximation(graph, h, layout):
         # subgraph (G[{vi,...,vj}],λ|E(G[{vi,...,vj}])) is at most h
         while (start <= end):
 
-            # the maximum endtime in the graph
-            maxEndtime = max_endtime(graph)
-
-            # generate a temporal subgraph with updated timespan and nodes
-            subgraph = graph.get_temporal_subgraph(intervals=(0, maxEndtime), nodes=layout[:mid + 1])
-
-            # calculate the maximum reachability in the subgraph
-            maxReachability = max_reachability(subgraph)
+            # calculate the maximum reachability in the temporal subgraph on {v1...vmid},
+            # within the graph's timespan
+            maxReachability = max_prefix_reachability(graph, layout, mid)
             if maxReachability > h:
                 end = mid - 1
             else:
@@ -277,8 +316,7 @@ def c_approximation(graph, h, layout):
         E_.extend(edgeList)
 
         # update (G, λ) ← (G, λ) \ E_
-        for edge in edgeList:
-            graph.remove_edge(edge)
+        graph.remove_edges(edgeList)
 
         i = mid + 1
 
@@ -1,8 +1,82 @@
 
+import numpy as np
+
 from overtime.components.trees import ForemostTree
 
 
 
+def calculate_foremost_times(graph, root):
+    """
+        A method which returns the foremost (earliest arrival) times from a root to every node, as arrays.
+
+        Parameter(s):
+        -------------
+        graph : TemporalDiGraph
+            A directed, temporal graph.
+        root : String
+            The label of a node.
+
+        Returns:
+        --------
+        arrival : Array
+            A float array indexed by node id (graph.ids), holding each node's foremost time.
+            The root's time is the graph's start time, unreachable nodes are at inf.
+        predecessor : Array
+            An integer array indexed by node id, holding the position in the graph's edge columns
+            (see TemporalEdges.columns) of the edge the node is reached by, or -1.
+
+        Example(s):
+        -----------
+            graph = TemporalDiGraph('test_network', data=CsvInput('./network.csv'))
+            arrival, predecessor = calculate_foremost_times(graph, 'a')
+            reachability_a = np.isfinite(arrival).sum()
+
+        Notes:
+        ------
+        A single scan of the edges in start time order, over the integer node id & time columns.
+        The columns are kept in the graph's cache until the graph changes, so each further root costs O(M).
+
+        See also:
+        ---------
+            calculate_foremost_tree
+            calculate_reachability
+    """
+
+    # check if the specified root actually exists in the graph.
+    if not graph.nodes.exists(root):
+        print('Error: ' + str(root) + ' does not exist in this graph.')
+        return None
+
+    labels, sources, sinks, starts, ends = graph.cached('edge_columns', graph.edges.columns)
+    times = [float('inf')] * len(labels) # foremost time of every node id.
+    previous = [-1] * len(labels) # edge position each node id is reached by.
+    if not len(starts):
+        times[graph.nodes.get(root).id] = 0
+        return np.array(times), np.array(previous, dtype=np.int64)
+
+    start = int(starts[0]) # start time.
+    end = int(ends.max()) - 1 # end time, the last time of the graph's timespan.
+    times[graph.nodes.get(root).id] = start
+
+    # foremost path algorithm:
+    # for every edge in the graph's edge columns (ordered by edge duration start times).
+    columns = zip(sources.tolist(), sinks.tolist(), starts.tolist(), ends.tolist())
+    for i, (source, sink, tstart, tend) in enumerate(columns):
+        # if the edge ends within the graph's timespan and leaves after the source's foremost time,
+        # else if the edge starts at or after the end of the graph's timespan.
+        if tend <= end and tstart >= times[source]:
+            # if the edge arrives before the sink's foremost time, it becomes the sink's foremost edge.
+            if tend < times[sink]:
+                times[sink] = tend
+                previous[sink] = i
+        elif tstart >= end:
+            # stop the algorithm.
+            break
+
+    return np.array(times), np.array(previous, dtype=np.int64)
+
+
+
 def calculate_foremost_tree(graph, root):
     """
         A method which returns the foremost tree for a specified root.
@@ -26,6 +100,7 @@ def calculate_foremost_tree(graph, root):
 
         See also:
         ---------
+            calculate_foremost_times
             calculate_reachability
     """
 
@@ -34,40 +109,30 @@ def calculate_foremost_tree(graph, root):
         print('Error: ' + str(root) + ' does not exist in this graph.')
         return None
 
-    timespan = graph.edges.timespan() # graph timespan.
-    start = timespan[0] # start time.
-    end = timespan[-1] # end time.
+    arrival, predecessor = calculate_foremost_times(graph, root)
+    labels, sources, sinks, starts, ends = graph.cached('edge_columns', graph.edges.columns)
+
+    # foremost times by node id, as integers (or inf for unreachable nodes).
+    times = [time if time == float('inf') else int(time) for time in arrival.tolist()]
 
     # initialize the foremost tree object.
-    tree = ForemostTree(graph.label, root, start)
+    tree = ForemostTree(graph.label, root, times[graph.nodes.get(root).id])
 
-    # add each node in the graph to the foremost tree.
-    # nodes in the foremost tree are of type ForemostNode and include a time property,
-    # which initializes at inf.
+    # add each node in the graph to the foremost tree, with its foremost time.
     for node in graph.nodes.set:
-        tree.nodes.add(node.label)
+        tree.nodes.add(node.label, times[node.id])
 
-    # foremost path algorithm:
-    # for every edge in the graph edges set (ordered by edge duration start times).
-    for edge in graph.edges.set:
-        departure = tree.nodes.get(edge.source.label) # departure node of edge
-        destination = tree.nodes.get(edge.sink.label) # destination node of edge
-
-        # if edge's duration end is less than or equal to the end time of the graph's timespan
-        # and edge's duration start is greater than or equal to the departure node's foremost time.
-        # else if edge's duration start is greater than or equal to the end time of the graph's timespan.
-        if edge.end <= end and edge.start >= departure.time:
-            # if edge's time duration end is less than the destination node's foremost time.
-            if edge.end < destination.time:
-                # add this edge to the foremost tree.
-                tree.edges.add(edge.source.label, edge.sink.label, tree.nodes, edge.start, edge.end)
-                # update the destination node's foremost time.
-                destination.time = edge.end
-                # update the destination node's data.
-                destination.data['foremost_time'] = edge.end
-        elif edge.start >= end:
-            # stop the algorithm.
-            break
+    # add the foremost edge of each reached node, in start time order.
+    rows = np.sort(predecessor[predecessor >= 0])
+    tree.edges.add_from(
+        zip(
+            [labels[i] for i in sources[rows].tolist()],
+            [labels[i] for i in sinks[rows].tolist()],
+            starts[rows].tolist(),
+            ends[rows].tolist()
+        ),
+        tree.nodes
+    )
 
     # return the resulting foremost tree.
     return tree
@@ -49,13 +49,18 @@ def calculate_fastest_path_durations(graph, root, interval=None):
     if not interval:
         interval = (0, graph.edges.end())
 
-    # Initialize lists for storing fastest path start and arrival times to each node
-    path_start_end_times = {label: [] for label in graph.nodes.labels()}
+    # Nodes are handled by their integer ids (see NodeIds), labels are only used for the result
+    ids = graph.ids
+    root_id = ids.get(root)
 
-    # Initialize dict for storing fastest path duration for each node
+    # Initialize lists for storing fastest path start and arrival times to each node, indexed by node id
+    path_start_end_times = [[] for _ in range(ids.count())]
+
+    # Initialize list for storing fastest path duration for each node
     # Root initialized to 0, rest to infinity
-    fastest_path_durations = {label: float("inf") for label in graph.nodes.labels()}
-    fastest_path_durations[root] = 0
+    durations = [float("inf")] * ids.count()
+    if root_id is not None:
+        durations[root_id] = 0
 
     # Get edge stream representation
     edge_stream = graph.edges.set
@@ -63,15 +68,15 @@ def calculate_fastest_path_durations(graph, root, interval=None):
     # Iterate over edge stream representation
     for edge in edge_stream:
 
-        u = edge.node1.label
-        v = edge.node2.label
+        u = edge.node1.id
+        v = edge.node2.id
         t = edge.start
 
         if interval[0] <= t <= interval[1]:
             # If source node of edge is root
-            if u == root:
-                if (t, t) not in path_start_end_times[root]:
-                    path_start_end_times[root].append([t, t])
+            if u == root_id:
+                if (t, t) not in path_start_end_times[root_id]:
+                    path_start_end_times[root_id].append([t, t])
 
             # If path start and arrival times do not yet exist for u, continue
             if not path_start_end_times[u]:
@@ -93,8 +98,12 @@ def calculate_fastest_path_durations(graph, root, interval=None):
                         break
 
             # If path faster than currently stored path, update stored duration
-            if new_arr_time - new_start_time < fastest_path_durations[v]:
-                fastest_path_durations[v] = new_arr_time - new_start_time
+            if new_arr_time - new_start_time < durations[v]:
+                durations[v] = new_arr_time - new_start_time
+
+    # Map the node ids back to labels
+    fastest_path_durations = {label: durations[ids.get(label)] for label in graph.nodes.labels()}
+    fastest_path_durations[root] = 0
 
     return fastest_path_durations
 
@@ -139,30 +148,35 @@ def calculate_shortest_path_lengths(graph, root, interval=None):
     if not interval:
         interval = (0, graph.edges.end())
 
-    # Initialize lists for storing shortest path distance and arrival times to each node
-    path_distance_end_times = {label: [] for label in graph.nodes.labels()}
+    # Nodes are handled by their integer ids (see NodeIds), labels are only used for the result
+    ids = graph.ids
+    root_id = ids.get(root)
 
-    # Initialize dict for storing fastest path duration for each node
+    # Initialize lists for storing shortest path distance and arrival times to each node, indexed by node id
+    path_distance_end_times = [[] for _ in range(ids.count())]
+
+    # Initialize list for storing fastest path duration for each node
     # Root initialized to 0, rest to infinity
-    shortest_path_lengths = {label: float("inf") for label in graph.nodes.labels()}
-    shortest_path_lengths[root] = 0
+    lengths = [float("inf")] * ids.count()
+    if root_id is not None:
+        lengths[root_id] = 0
 
     # Get edge stream representation
     edge_stream = graph.edges.set
 
     for edge in edge_stream:
 
-        u = edge.node1.label
-        v = edge.node2.label
+        u = edge.node1.id
+        v = edge.node2.id
         t = edge.start
         dur = edge.duration
 
         if interval[0] <= t and t + dur <= interval[1]:
 
             # If source node of edge is root
-            if u == root:
-                if (0, t) not in path_distance_end_times[root]:
-                    path_distance_end_times[root].append([0, t])
+            if u == root_id:
+                if (0, t) not in path_distance_end_times[root_id]:
+                    path_distance_end_times[root_id].append([0, t])
 
             # If path start and arrival times do not yet exist for u, continue
             if not path_distance_end_times[u]:
@@ -184,7 +198,11 @@ def calculate_shortest_path_lengths(graph, root, interval=None):
                         break
 
             # If path shorter than currently stored path, update stored duration
-            if new_distance < shortest_path_lengths[v]:
-                shortest_path_lengths[v] = new_distance
+            if new_distance < lengths[v]:
+                lengths[v] = new_distance
+
+    # Map the node ids back to labels
+    shortest_path_lengths = {label: lengths[ids.get(label)] for label in graph.nodes.labels()}
+    shortest_path_lengths[root] = 0
 
     return shortest_path_lengths
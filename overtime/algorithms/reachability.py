@@ -1,5 +1,10 @@
 
-from overtime.algorithms.foremost import calculate_foremost_tree
+import heapq
+from collections import defaultdict
+
+import numpy as np
+
+from overtime.algorithms.foremost import calculate_foremost_times
 
 
 
@@ -26,6 +31,7 @@ def calculate_reachability(graph, root):
 
         See also:
         ---------
+            calculate_foremost_times
             calculate_foremost_tree
     """
 
@@ -34,11 +40,439 @@ def calculate_reachability(graph, root):
         print('Error: ' + str(root) + ' does not exist in this graph.')
         return None
 
-    # calculate the foremost tree of the root node.
-    tree = calculate_foremost_tree(graph, root)
+    # count the nodes with a foremost time from the root node, the count is kept until the graph changes.
+    reachability = graph.cached(
+        ('reachability', root), lambda: int(np.isfinite(calculate_foremost_times(graph, root)[0]).sum())
+    )
     # get the root node object in the graph.
     root_node = graph.nodes.get(root)
     # update the root node's data.
-    root_node.data['reachability'] = tree.nodes.get_reachable().count()
+    root_node.data['reachability'] = reachability
     # return the reachable node count.
     return root_node.data['reachability']
+
+
+
+def count_reachable(columns, roots, block=512):
+    """
+        A method which returns the reachability of each of some roots, from a graph's edge columns.
+
+        Parameter(s):
+        -------------
+        columns : Tuple
+            The node labels & edge columns of a graph, see TemporalEdges.columns.
+            The edges may be any selection of rows, kept in the order they are to be scanned in.
+        roots : List
+            The ids of the root nodes, see NodeIds.
+        block : Integer
+            The number of roots scanned together, memory use is (node ids x block) floats.
+            Default value: 512
+
+        Returns:
+        --------
+        reachabilities : List
+            The number of reachable nodes from each root, as calculate_reachability counts them for the edges.
+
+        Notes:
+        ------
+        The scan of calculate_foremost_times, run for a block of roots at once over a (node ids x roots) matrix of
+        foremost times, so each edge costs a few vector operations per block rather than one step per root.
+        Edges whose source none of the roots has reached yet are skipped without any vector operations.
+
+        See also:
+        ---------
+            calculate_all_reachabilities
+            calculate_foremost_times
+    """
+    labels, sources, sinks, starts, ends = columns
+    counts = [1] * len(roots) # without edges, the roots reach only themselves.
+    if not len(starts):
+        return counts
+    start = int(starts[0]) # start time.
+    end = int(ends.max()) - 1 # end time, the last time of the graph's timespan.
+    # edges that start before the end of the graph's timespan, and end within it, are used whenever their
+    # source is reached in time. the scan stops for a root at the first later edge it cannot use.
+    head = np.flatnonzero((starts < end) & (ends <= end))
+    tail = np.flatnonzero(starts >= end)
+    head = list(zip(sources[head].tolist(), sinks[head].tolist(), starts[head].tolist(), ends[head].tolist()))
+    tail = list(zip(sources[tail].tolist(), sinks[tail].tolist(), starts[tail].tolist(), ends[tail].tolist()))
+    for first in range(0, len(roots), block):
+        ids = roots[first:first + block]
+        # foremost times, one row per node id & one column per root.
+        times = np.full((len(labels), len(ids)), np.inf)
+        times[ids, np.arange(len(ids))] = start
+        reached = [False] * len(labels) # whether any of the roots has reached a node id yet.
+        for i in ids:
+            reached[i] = True
+        for source, sink, tstart, tend in head:
+            if reached[source]:
+                np.minimum(times[sink], np.where(times[source] <= tstart, tend, np.inf), out=times[sink])
+                reached[sink] = True
+        running = np.ones(len(ids), dtype=bool) # roots whose scan has not stopped.
+        for source, sink, tstart, tend in tail:
+            running &= (times[source] <= tstart) & (tend <= end)
+            if not running.any():
+                break
+            np.minimum(times[sink], np.where(running, tend, np.inf), out=times[sink])
+        counts[first:first + block] = np.isfinite(times).sum(axis=0).tolist()
+    return counts
+
+
+
+def calculate_all_reachabilities(graph, update=True, block=512):
+    """
+        A method which returns the reachability of every node in the graph, in one batched pass.
+
+        Parameter(s):
+        -------------
+        graph : TemporalDiGraph
+            A directed, temporal graph.
+        update : Boolean
+            Whether to store each node's reachability in its data, as calculate_reachability does.
+            Default value: True
+        block : Integer
+            The number of roots scanned together, memory use is (node ids x block) floats.
+            Default value: 512
+
+        Returns:
+        --------
+        reachabilities : Dictionary
+            Node label -> the number of reachable nodes from that node, in the order of graph.nodes.set.
+
+        Example(s):
+        -----------
+            graph = TemporalDiGraph('test_network', data=CsvInput('./network.csv'))
+            reachabilities = calculate_all_reachabilities(graph)
+            max_reachability = max(reachabilities.values())
+
+        Notes:
+        ------
+        The roots are scanned in blocks by count_reachable, over the graph's edge columns.
+        The counts are kept in the graph's cache, calculate_reachability returns them until the graph changes.
+
+        See also:
+        ---------
+            calculate_reachability
+            count_reachable
+    """
+
+    nodes = list(graph.nodes.set)
+    columns = graph.cached('edge_columns', graph.edges.columns)
+    counts = count_reachable(columns, [node.id for node in nodes], block)
+
+    reachabilities = dict()
+    for node, count in zip(nodes, counts):
+        reachabilities[node.label] = graph.cached(('reachability', node.label), lambda count=count: count)
+        if update:
+            node.data['reachability'] = count
+    return reachabilities
+
+
+
+def calculate_reachability_matrix(graph):
+    """
+        A method which returns the temporal reachability matrix of the graph, who can reach whom.
+
+        Parameter(s):
+        -------------
+        graph : TemporalDiGraph
+            A directed, temporal graph.
+
+        Returns:
+        --------
+        labels : List
+            The node labels, in the order of graph.nodes.set, indexing the rows & columns of the matrix.
+        matrix : Array
+            A boolean (nodes x nodes) array, matrix[i, j] is True if labels[j] is reachable from labels[i].
+            Every node reaches itself, as in calculate_reachability.
+        reachable : Dictionary
+            Node label -> the number of nodes reachable from it, the matrix's row sums.
+        reached_by : Dictionary
+            Node label -> the number of nodes it is reachable from, the matrix's column sums.
+
+        Example(s):
+        -----------
+            graph = TemporalDiGraph('test_network', data=CsvInput('./network.csv'))
+            labels, matrix, reachable, reached_by = calculate_reachability_matrix(graph)
+
+        Notes:
+        ------
+        A single reverse sweep of the edges, keeping each node's reachable set as a packed bit array of uint64 words.
+        An edge u -> v adds v, and what v reaches by the edges that leave it in time, to u's set, in O(N/64) words.
+        So the whole matrix costs O(M*N/64), rather than the O(N*M) of a foremost scan per root.
+        The reachable sets follow the same rules as calculate_reachability, and reachable matches its counts.
+
+        See also:
+        ---------
+            calculate_reachability
+            calculate_all_reachabilities
+    """
+
+    nodes = list(graph.nodes.set)
+    labels = [node.label for node in nodes]
+    n = len(nodes)
+    position = {node.id: i for i, node in enumerate(nodes)} # node id -> row/column of the matrix.
+    word = [i // 64 for i in range(n)] # the word holding each node's bit.
+    bit = [np.uint64(1 << (i % 64)) for i in range(n)] # each node's bit within its word.
+    sets = np.zeros((n, (n + 63) // 64), dtype=np.uint64) # packed reachable sets, one row per node.
+
+    _, sources, sinks, starts, ends = graph.cached('edge_columns', graph.edges.columns)
+    if len(starts):
+        end = int(ends.max()) - 1 # end time, the last time of the graph's timespan.
+        sources = [position[i] for i in sources.tolist()]
+        sinks = [position[i] for i in sinks.tolist()]
+        # the edges after edge i that can follow it are those from the first one starting at or after its end.
+        follows = np.maximum(np.arange(1, len(starts) + 1), np.searchsorted(starts, ends, side='left')).tolist()
+        usable = ((starts < end) & (ends <= end)).tolist()
+        tends = ends.tolist()
+
+        # reverse sweep of the edges that start before the end of the graph's timespan & end within it.
+        # before edge i - 1 is added, 'sets' holds what each node reaches by edges i onwards, so this is when
+        # the edges that edge i can follow take a copy of their sink's set.
+        waiting = defaultdict(list) # position in the sweep -> edges taking a copy of their sink's set there.
+        for i in range(len(starts)):
+            if usable[i]:
+                waiting[follows[i]].append(i)
+        copies = dict() # edge -> its sink & what its sink reaches in time.
+        for i in range(len(starts), 0, -1):
+            for j in waiting.pop(i, ()):
+                copies[j] = sets[sinks[j]].copy()
+                copies[j][word[sinks[j]]] |= bit[sinks[j]]
+            if usable[i - 1]:
+                sets[sources[i - 1]] |= copies.pop(i - 1)
+
+        # every node reaches itself.
+        for i in range(n):
+            sets[i, word[i]] |= bit[i]
+
+        # edges starting at or after the end of the graph's timespan are scanned forwards, as the foremost
+        # scan stops for a root at the first of them it cannot use.
+        running = np.ones(n, dtype=bool)
+        for i in np.flatnonzero(starts >= end).tolist():
+            if tends[i] > end:
+                break
+            running &= (sets[:, word[sources[i]]] & bit[sources[i]]) != 0
+            if not running.any():
+                break
+            sets[running, word[sinks[i]]] |= bit[sinks[i]]
+    else:
+        for i in range(n):
+            sets[i, word[i]] |= bit[i]
+
+    # unpack the bits, bit b of word w is column 64 * w + b.
+    matrix = np.unpackbits(sets.astype('<u8').view(np.uint8), axis=1, bitorder='little')[:, :n].astype(bool)
+    reachable = dict(zip(labels, matrix.sum(axis=1).tolist()))
+    reached_by = dict(zip(labels, matrix.sum(axis=0).tolist()))
+    return labels, matrix, reachable, reached_by
+
+
+
+class IncrementalReachability:
+    """
+        A class to represent the reachability of every node in a graph, kept up to date as edges are removed.
+
+        Parameter(s):
+        -------------
+        graph : TemporalDiGraph
+            A directed, temporal graph.
+        block : Integer
+            The number of roots scanned together, see calculate_all_reachabilities.
+            Default value: 512
+
+        Object Propertie(s):
+        --------------------
+        graph : TemporalDiGraph
+            The graph whose reachabilities are kept.
+        block : Integer
+            The number of roots scanned together.
+        order : Dictionary
+            Node label -> the position of the node in graph.nodes.set when the object was created.
+        reachability : Dictionary
+            Node label -> the number of reachable nodes from that node, as calculate_reachability returns.
+        uses : Dictionary
+            Node label -> the edges the node's foremost scan depends on.
+        users : Dictionary
+            Edge -> the labels of the nodes whose foremost scans depend on the edge.
+        end : Integer
+            The end time of the graph's timespan the reachabilities were found for, None without edges.
+
+        Example(s):
+        -----------
+            graph = TemporalDiGraph('test_network', data=CsvInput('./network.csv'))
+            reachabilities = IncrementalReachability(graph)
+            reachabilities.remove_edges(['a-b|1-2', 'b-c|2-3'])
+            root = reachabilities.first_above(3)
+
+        Notes:
+        ------
+        A root's foremost scan depends on the edges that lowered a foremost time, and on the edge it stopped at.
+        Removing any other edge leaves the scan's result as it was, so after a batch of removals only the roots
+        that depended on a removed edge are scanned again. All roots are scanned again if the end of the graph's
+        timespan moves, as it decides which edges can be used. Nodes must not be added or removed meanwhile.
+
+        See also:
+        ---------
+            calculate_reachability
+            calculate_all_reachabilities
+            h_approximation
+    """
+
+    def __init__(self, graph, block=512):
+        self.graph = graph
+        self.block = block
+        self.order = {node.label: i for i, node in enumerate(graph.nodes.set)}
+        self.reachability = dict()
+        self.uses = dict()
+        self.users = defaultdict(set)
+        self.end = None
+        self._maximum = [] # heap of (-reachability, order, label), stale entries are skipped when read.
+        self._above = dict() # h -> heap of (order, label) for the roots found above h, see first_above.
+        self.refresh(list(self.order))
+
+
+    def refresh(self, labels):
+        """
+            A method of IncrementalReachability.
+
+            Parameter(s):
+            -------------
+            labels : List
+                The labels of the roots to scan again.
+
+            Returns:
+            --------
+                None, updates the reachability & dependencies of the roots, and their data['reachability'].
+        """
+        columns = self.graph.cached('edge_columns', self.graph.edges.columns)
+        end = int(columns[4].max()) - 1 if len(columns[4]) else None
+        if end != self.end:
+            # the end of the graph's timespan decides which edges can be used, so every root is scanned again.
+            self.end, labels = end, list(self.order)
+        edges = self.graph.edges.set
+        for first in range(0, len(labels), self.block):
+            roots = labels[first:first + self.block]
+            counts, used = self.scan(roots, columns)
+            for label, count, positions in zip(roots, counts, used):
+                for edge in self.uses.get(label, ()):
+                    self.users[edge].discard(label)
+                self.uses[label] = [edges[i] for i in positions]
+                for edge in self.uses[label]:
+                    self.users[edge].add(label)
+                self.reachability[label] = count
+                self.graph.nodes.get(label).data['reachability'] = count
+                heapq.heappush(self._maximum, (-count, self.order[label], label))
+                for h, heap in self._above.items():
+                    if count > h:
+                        heapq.heappush(heap, (self.order[label], label))
+
+
+    def scan(self, labels, columns):
+        """
+            A method of IncrementalReachability.
+
+            Parameter(s):
+            -------------
+            labels : List
+                The labels of the root nodes.
+            columns : Tuple
+                The graph's edge columns, see TemporalEdges.columns.
+
+            Returns:
+            --------
+            reachabilities : List
+                The number of reachable nodes from each root, see calculate_foremost_times.
+            used : List
+                For each root, the positions of the edges its scan depends on.
+        """
+        _, sources, sinks, starts, ends = columns
+        used = [[] for label in labels]
+        if not len(starts):
+            return [1] * len(labels), used
+        end = self.end
+        # the foremost scan of calculate_all_reachabilities, noting which roots each edge is used by.
+        roots = [self.graph.nodes.get(label).id for label in labels]
+        times = np.full((len(self.graph.ids.labels), len(labels)), np.inf)
+        times[roots, np.arange(len(labels))] = starts[0]
+        reached = [False] * len(self.graph.ids.labels) # whether any of the roots has reached a node id yet.
+        for root in roots:
+            reached[root] = True
+        running = np.ones(len(labels), dtype=bool) # roots whose scan has not stopped.
+        rows = zip(sources.tolist(), sinks.tolist(), starts.tolist(), ends.tolist())
+        for i, (source, sink, tstart, tend) in enumerate(rows):
+            if tstart < end:
+                if tend > end or not reached[source]:
+                    continue
+                lowered = ((times[source] <= tstart) & (tend < times[sink])).nonzero()[0]
+            else:
+                # the scan stops for a root at the first of these edges it cannot use.
+                usable = running & (times[source] <= tstart) & (tend <= end)
+                for r in (running & ~usable).nonzero()[0].tolist():
+                    used[r].append(i)
+                running = usable
+                lowered = (usable & (tend < times[sink])).nonzero()[0]
+            if len(lowered):
+                times[sink, lowered] = tend
+                reached[sink] = True
+                for r in lowered.tolist():
+                    used[r].append(i)
+            if tstart >= end and not running.any():
+                break
+        return np.isfinite(times).sum(axis=0).tolist(), used
+
+
+    def remove_edges(self, uids):
+        """
+            A method of IncrementalReachability.
+
+            Parameter(s):
+            -------------
+            uids : Iterable
+                The uids of the edges to remove from the graph.
+
+            Returns:
+            --------
+                None, removes the edges from the graph & scans again the roots that depended on them.
+        """
+        uids = [str(uid) for uid in uids]
+        affected = set()
+        for uid in uids:
+            affected |= self.users.pop(self.graph.edges.get_edge_by_uid(uid), set())
+        self.graph.remove_edges(uids)
+        self.refresh(sorted(affected, key=self.order.get))
+
+
+    def maximum(self):
+        """
+            A method of IncrementalReachability.
+
+            Returns:
+            --------
+            reachability : Integer
+                The largest reachability of any node in the graph, 0 without nodes.
+        """
+        while self._maximum and self.reachability[self._maximum[0][2]] != -self._maximum[0][0]:
+            heapq.heappop(self._maximum)
+        return -self._maximum[0][0] if self._maximum else 0
+
+
+    def first_above(self, h):
+        """
+            A method of IncrementalReachability.
+
+            Parameter(s):
+            -------------
+            h : Integer
+                A reachability threshold.
+
+            Returns:
+            --------
+            label : String
+                The label of the first node in node order whose reachability is more than h, None if there is none.
+        """
+        if h not in self._above:
+            self._above[h] = [(self.order[label], label) for label, count in self.reachability.items() if count > h]
+            heapq.heapify(self._above[h])
+        heap = self._above[h]
+        while heap and self.reachability[heap[0][1]] <= h:
+            heapq.heappop(heap)
+        return heap[0][1] if heap else None
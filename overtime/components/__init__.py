@@ -5,6 +5,8 @@ from overtime.components.nodes import *
 # edges
 from overtime.components.edges import *
 from overtime.components.arcs import *
+from overtime.components.columnar import *
+from overtime.components.streaming import *
 
 # graphs
 from overtime.components.graphs import *
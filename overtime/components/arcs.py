@@ -9,11 +9,21 @@ class Arc(Edge):
         A class which represents a directed edge (arc) on a graph.
     """
 
+    __slots__ = ()
+    directed = True
+
     def __init__(self, source, sink, nodes):
         super().__init__(source, sink, nodes)
-        self.directed = True
-        self.source = self.node1
-        self.sink = self.node2
+
+
+    @property
+    def source(self):
+        return self.node1
+
+
+    @property
+    def sink(self):
+        return self.node2
         
 
 
@@ -22,11 +32,21 @@ class TemporalArc(TemporalEdge):
         A class which represents a time-respecting directed edge (arc) on a temporal graph.
     """
 
+    __slots__ = ()
+    directed = True
+
     def __init__(self, source, sink, nodes, tstart, tend):
         super().__init__(source, sink, nodes, tstart, tend)
-        self.directed = True
-        self.source = self.node1
-        self.sink = self.node2
+
+
+    @property
+    def source(self):
+        return self.node1
+
+
+    @property
+    def sink(self):
+        return self.node2
 
 
 
@@ -34,6 +54,7 @@ class Arcs(Edges):
     """
         A class which represents a collection of arcs.
     """
+    _edgeclass = Arc
 
     def __init__(self, graph):
         super().__init__(graph)
@@ -42,23 +63,27 @@ class Arcs(Edges):
     def add(self, source, sink, nodes):
         label = str(source) + '-' + str(sink) # directed label
         if not self.exists(label):
-            self.set.add(Arc(source, sink, nodes))
+            self.insert(Arc(source, sink, nodes))
         return self.get_edge_by_uid(label)
 
 
+    def endpoints(self, source, sink):
+        return [str(source), str(sink)] # directed, order is kept
+
+
     def subset(self, alist):
         subset = Arcs(self.graph)
         for edge in alist:
-            subset.set.add(edge)
+            subset.insert(edge)
         return subset
 
 
     def get_edge_by_source(self, label):
-        return self.subset([edge for edge in self.set if edge.source.label == label])
+        return self.get_edge_by_node1(label)
 
 
     def get_edge_by_sink(self, label):
-        return self.subset([edge for edge in self.set if edge.sink.label == label])
+        return self.get_edge_by_node2(label)
 
 
 
@@ -66,6 +91,7 @@ class TemporalArcs(TemporalEdges):
     """
         A class which represents a collection of temporal arcs.
     """
+    _edgeclass = TemporalArc
 
     def __init__(self, graph):
         super().__init__(graph)
@@ -74,25 +100,28 @@ class TemporalArcs(TemporalEdges):
     def add(self, source, sink, nodes, tstart, tend=None):
         if tend is None:
             tend = int(tstart) + 0 # default duration of 1
+        tstart, tend = int(tstart), int(tend)
         uid = str(source) + '-' + str(sink) + '|' + str(tstart) + '-' + str(tend) # directed uid
         if not self.exists(uid):
             edge = TemporalArc(source, sink, nodes, tstart, tend)
-            self.set.append(edge)
-            self.set = self.sort(self.set)
+            self.insert(edge)
+            return edge
         return self.get_edge_by_uid(uid)
 
 
+    def endpoints(self, source, sink):
+        return [str(source), str(sink)] # directed, order is kept
+
+
     def subset(self, alist):
         subset = TemporalArcs(self.graph)
-        for edge in alist:
-            subset.set.append(edge)
-        subset.set = subset.sort(subset.set)
+        subset.set = alist
         return subset
 
 
-    def get_edge_by_source(self, label):
-        return self.subset([edge for edge in self.set if edge.source.label == label])
+    def get_edge_by_source(self, label, time=None):
+        return self.get_edge_by_node1(label, time)
 
 
-    def get_edge_by_sink(self, label):
-        return self.subset([edge for edge in self.set if edge.sink.label == label])
+    def get_edge_by_sink(self, label, time=None):
+        return self.get_edge_by_node2(label, time)
@@ -0,0 +1,641 @@
+from array import array
+
+import numpy as np
+
+from overtime.components.edges import TemporalEdges
+from overtime.components.arcs import TemporalArcs
+
+
+
+class ColumnarTemporalEdges(TemporalEdges):
+    """
+        A class to represent a collection of temporal edges on a graph, stored as columns.
+        Inherits the query methods of TemporalEdges.
+
+        Edges are held as int32 node1/node2 id arrays and int64 start/end arrays, ordered by start time,
+        at roughly 24 bytes per edge. TemporalEdge objects are only created when they are asked for,
+        through set, aslist or a query, so objects returned by separate calls may not be identical (compare uids).
+        The object returned by add is the exception: it is kept and handed out again for its row.
+
+        Parameter(s):
+        -------------
+        graph : Graph
+            A valid Graph class/subclass.
+
+        Object Propertie(s):
+        --------------------
+        graph : Graph
+            Inherited from Edges.
+        set : List
+            The list of edges, ordered by edge start time, created from the columns on demand.
+        index : Dictionary
+            A lookup of the edges in set, keyed by uid.
+        node1s, node2s : numpy.ndarray
+            The int32 node1 & node2 id columns, holding ids from the graph's id table (graph.ids).
+        starts, ends : numpy.ndarray
+            The int64 start & end time columns.
+
+        See also:
+        ---------
+            TemporalEdges
+            ColumnarTemporalArcs
+    """
+
+    def __init__(self, graph):
+        # the columns replace the list & uid dictionary of TemporalEdges, so its constructor is not used.
+        self.graph = graph
+        self._view, self._dead = None, set() # the columns are never a view and keep no tombstones.
+        self._views = [] # queries return materialised subsets rather than views.
+        self.version = 0 # changes with the edges held, see Graph.cached.
+        self.clear()
+
+
+    def clear(self):
+        """
+            A method of ColumnarTemporalEdges.
+
+            Returns:
+            --------
+                None, removes all edges from the collection (node ids are kept).
+        """
+        self.version += 1
+        self.node1s = np.empty(0, dtype=np.int32)
+        self.node2s = np.empty(0, dtype=np.int32)
+        self.starts = np.empty(0, dtype=np.int64)
+        self.ends = np.empty(0, dtype=np.int64)
+        self.buffer = (array('i'), array('i'), array('q'), array('q')) # appended rows, not yet sorted.
+        self.added = dict() # (node1 id, node2 id, start, end) -> edge object returned by add.
+        self.changed()
+
+
+    def changed(self):
+        """
+            A method of ColumnarTemporalEdges.
+
+            Returns:
+            --------
+                None, drops everything derived from the columns (materialised objects, lookups & indexes).
+        """
+        self.objects = None # materialised edge objects, aligned with the columns.
+        self.lookup = None # uid -> materialised edge object.
+        self.maxends = None # running maximum of the end column.
+        self._end = None # largest end time, found on first use.
+        self._adjacency, self._node_intervals = None, dict() # per-node lists of materialised objects.
+        self._groups = None # label -> (start, end) pairs, see TemporalEdges.group_by_label.
+
+
+    @property
+    def set(self):
+        self.consolidate()
+        if self.objects is None:
+            self.objects = self.materialise(range(len(self.starts)))
+        return self.objects
+
+
+    @set.setter
+    def set(self, alist):
+        self.clear()
+        for edge in alist:
+            self.insert(edge)
+
+
+    @property
+    def index(self):
+        if self.lookup is None:
+            self.lookup = {edge.uid: edge for edge in self.set}
+        return self.lookup
+
+
+    def get_edge_by_uid(self, uid):
+        """
+            A method of ColumnarTemporalEdges.
+
+            Parameter(s):
+            -------------
+            uid : String
+                The unique label of an edge.
+
+            Returns:
+            --------
+            edge : TemporalEdge
+                The corresponding (materialised) edge object.
+        """
+        return self.index.get(uid)
+
+
+    def clone(self, graph):
+        """
+            A method of ColumnarTemporalEdges.
+
+            Parameter(s):
+            -------------
+            graph : Graph
+                The graph the clone belongs to.
+
+            Returns:
+            --------
+            clone : ColumnarTemporalEdges
+                A copy of the collection sharing the column arrays, which are replaced rather than changed in place.
+        """
+        self.consolidate()
+        clone = self.__class__(graph)
+        clone.node1s, clone.node2s, clone.starts, clone.ends = self.node1s, self.node2s, self.starts, self.ends
+        return clone
+
+
+    def compact(self):
+        """
+            A method of ColumnarTemporalEdges.
+
+            Returns:
+            --------
+                None, the column arrays are only ever replaced (removals included) so there is nothing to copy or drop.
+        """
+        pass
+
+
+    def intern(self, label, nodes):
+        """
+            A method of ColumnarTemporalEdges.
+
+            Parameter(s):
+            -------------
+            label : String
+                The label of a node.
+            nodes : Nodes
+                A valid Nodes class/subclass, the node is added to it if missing.
+
+            Returns:
+            --------
+            id : Integer
+                The id of the node in the graph's id table, as stored in the node1/node2 columns.
+        """
+        if not nodes.exists(label):
+            nodes.add(label)
+        return self.graph.ids.intern(label)
+
+
+    def add(self, node1, node2, nodes, tstart, tend=None):
+        """
+            A method of ColumnarTemporalEdges.
+
+            Parameter(s):
+            -------------
+            node1 : String
+                The label of the node1 connection.
+            node2 : String
+                The label of the node2 connection.
+            nodes : Nodes
+                A valid Nodes class/subclass.
+            tstart : Integer
+                The start time of the temporal edge.
+            tend : Integer
+                The end time of the temporal edge.
+
+            Returns:
+            --------
+            edge : TemporalEdge
+                The edge object for the added (or already existing) edge, the one get_edge_by_uid returns for it.
+        """
+        if tend is None:
+            tend = int(tstart) + 0 # default duration of 0.
+        tstart, tend = int(tstart), int(tend)
+        self.add_from(((node1, node2, tstart, tend),), nodes)
+        node_labels = self.endpoints(node1, node2)
+        ids = self.graph.ids
+        key = (ids.get(node_labels[0]), ids.get(node_labels[1]), tstart, tend)
+        # the object is kept so that materialising the row hands out the same object, see materialise.
+        if key not in self.added:
+            self.added[key] = self._edgeclass(node_labels[0], node_labels[1], nodes, tstart, tend)
+        return self.added[key]
+
+
+    def add_from(self, edges, nodes):
+        """
+            A method of ColumnarTemporalEdges.
+
+            Parameter(s):
+            -------------
+            edges : Iterable
+                An iterable of (node1, node2, tstart, tend) tuples, tend may be None.
+            nodes : Nodes
+                A valid Nodes class/subclass.
+
+            Returns:
+            --------
+                None, appends the edges to the columns.
+                Duplicates are dropped and the columns sorted once, when the collection is next read.
+        """
+        node1s, node2s, starts, ends = self.buffer
+        for node1, node2, tstart, tend in edges:
+            if tend is None:
+                tend = int(tstart) + 0 # default duration of 0.
+            node_labels = self.endpoints(node1, node2)
+            node1s.append(self.intern(node_labels[0], nodes))
+            node2s.append(self.intern(node_labels[1], nodes))
+            starts.append(int(tstart))
+            ends.append(int(tend))
+        self.version += 1
+        self.changed()
+
+
+    def add_arrays(self, node1, node2, tstart, tend, nodes):
+        """
+            A method of ColumnarTemporalEdges.
+
+            Parameter(s):
+            -------------
+            node1 : List/Array
+                The node1 labels of the edges.
+            node2 : List/Array
+                The node2 labels of the edges.
+            tstart : List/Array
+                The start times of the edges.
+            tend : List/Array
+                The end times of the edges, or None for a duration of 0.
+            nodes : Nodes
+                A valid Nodes class/subclass.
+
+            Returns:
+            --------
+                None, appends the edges to the columns without a per-edge Python loop.
+        """
+        node1 = np.asarray(node1).astype(str)
+        node2 = np.asarray(node2).astype(str)
+        tstart = np.asarray(tstart).astype(np.int64)
+        tend = tstart if tend is None else np.asarray(tend).astype(np.int64)
+        node1, node2 = self.endpoint_arrays(node1, node2)
+        # intern each distinct label once.
+        labels, inverse = np.unique(np.concatenate((node1, node2)), return_inverse=True)
+        ids = np.array([self.intern(label, nodes) for label in labels.tolist()], dtype=np.int32)[inverse.ravel()]
+        node1s, node2s, starts, ends = self.buffer
+        node1s.frombytes(ids[:len(node1)].astype(np.int32).tobytes())
+        node2s.frombytes(ids[len(node1):].astype(np.int32).tobytes())
+        starts.frombytes(tstart.tobytes())
+        ends.frombytes(tend.tobytes())
+        self.version += 1
+        self.changed()
+
+
+    def endpoint_arrays(self, node1, node2):
+        """
+            A method of ColumnarTemporalEdges.
+
+            Returns:
+            --------
+            node1, node2 : numpy.ndarray
+                The label arrays in uid order (alphabetical per edge, as edges are undirected).
+        """
+        swap = node1 > node2
+        return np.where(swap, node2, node1), np.where(swap, node1, node2)
+
+
+    def insert(self, edge):
+        """
+            A method of ColumnarTemporalEdges.
+
+            Parameter(s):
+            -------------
+            edge : TemporalEdge
+                An existing temporal edge object.
+
+            Returns:
+            --------
+                None, appends the edge's values to the columns.
+        """
+        self.add_from(((edge.node1.label, edge.node2.label, edge.start, edge.end),), self.graph.nodes)
+
+
+    def discard(self, edge):
+        """
+            A method of ColumnarTemporalEdges.
+
+            Parameter(s):
+            -------------
+            edge : TemporalEdge
+                A temporal edge object (or an equal one) in the collection.
+
+            Returns:
+            --------
+                None, removes the edge's row from the columns.
+        """
+        self.consolidate()
+        i = self.row(edge)
+        if i is None:
+            return
+        self.added.pop((int(self.node1s[i]), int(self.node2s[i]), int(self.starts[i]), int(self.ends[i])), None)
+        self.node1s = np.delete(self.node1s, i)
+        self.node2s = np.delete(self.node2s, i)
+        self.starts = np.delete(self.starts, i)
+        self.ends = np.delete(self.ends, i)
+        # keep any materialised objects aligned with the columns.
+        objects, lookup = self.objects, self.lookup
+        self.version += 1
+        self.changed()
+        if objects is not None:
+            del objects[i]
+            self.objects = objects
+        if lookup is not None:
+            del lookup[edge.uid]
+            self.lookup = lookup
+
+
+    def discard_from(self, edges):
+        """
+            A method of ColumnarTemporalEdges.
+
+            Parameter(s):
+            -------------
+            edges : Iterable
+                Distinct temporal edge objects (or equal ones) in the collection.
+
+            Returns:
+            --------
+                None, removes the edges' rows from the columns in one pass.
+        """
+        self.consolidate()
+        dead = np.zeros(len(self.starts), dtype=bool)
+        for edge in edges:
+            i = self.row(edge)
+            if i is not None:
+                dead[i] = True
+        self.discard_where(dead)
+
+
+    def discard_where(self, mask):
+        """
+            A method of ColumnarTemporalEdges.
+
+            Parameter(s):
+            -------------
+            mask : Function/List/numpy.ndarray
+                A function returning True for each edge to remove,
+                or booleans aligned with the columns (start time order, True to remove).
+
+            Returns:
+            --------
+                None, removes the selected rows from the columns in one pass.
+        """
+        self.consolidate()
+        if callable(mask):
+            mask = [mask(edge) for edge in self.set]
+        keep = ~np.asarray(mask, dtype=bool)
+        if keep.all():
+            return
+        if self.added:
+            dead = ~keep
+            for key in zip(
+                self.node1s[dead].tolist(), self.node2s[dead].tolist(),
+                self.starts[dead].tolist(), self.ends[dead].tolist()
+            ):
+                self.added.pop(key, None)
+        self.node1s, self.node2s = self.node1s[keep], self.node2s[keep]
+        self.starts, self.ends = self.starts[keep], self.ends[keep]
+        # keep any materialised objects aligned with the columns.
+        objects = self.objects
+        self.version += 1
+        self.changed()
+        if objects is not None:
+            self.objects = [edge for edge, kept in zip(objects, keep.tolist()) if kept]
+
+
+    def row(self, edge):
+        """
+            A method of ColumnarTemporalEdges.
+
+            Parameter(s):
+            -------------
+            edge : TemporalEdge
+                A temporal edge object.
+
+            Returns:
+            --------
+            row : Integer
+                The position of the edge in the columns, or None.
+        """
+        node1 = self.graph.ids.get(edge.node1.label)
+        node2 = self.graph.ids.get(edge.node2.label)
+        lo = np.searchsorted(self.starts, edge.start, 'left')
+        hi = np.searchsorted(self.starts, edge.start, 'right')
+        for i in range(lo, hi):
+            if self.node1s[i] == node1 and self.node2s[i] == node2 and self.ends[i] == edge.end:
+                return i
+        return None
+
+
+    def consolidate(self):
+        """
+            A method of ColumnarTemporalEdges.
+
+            Returns:
+            --------
+                None, merges appended rows into the columns, dropping duplicates and sorting by start time.
+        """
+        if not len(self.buffer[2]):
+            return
+        node1s, node2s, starts, ends = self.buffer
+        node1 = np.concatenate((self.node1s, np.frombuffer(node1s, dtype=np.int32)))
+        node2 = np.concatenate((self.node2s, np.frombuffer(node2s, dtype=np.int32)))
+        start = np.concatenate((self.starts, np.frombuffer(starts, dtype=np.int64)))
+        end = np.concatenate((self.ends, np.frombuffer(ends, dtype=np.int64)))
+        self.buffer = (array('i'), array('i'), array('q'), array('q'))
+        # a stable sort by start time keeps ties in insertion order, as in TemporalEdges.
+        order = np.argsort(start, kind='stable')
+        node1, node2, start, end = node1[order], node2[order], start[order], end[order]
+        # group identical rows together (first occurrence first) and keep only the first of each.
+        rows = np.lexsort((np.arange(len(start)), end, node2, node1, start))
+        same = (
+            (node1[rows[1:]] == node1[rows[:-1]]) & (node2[rows[1:]] == node2[rows[:-1]]) &
+            (start[rows[1:]] == start[rows[:-1]]) & (end[rows[1:]] == end[rows[:-1]])
+        )
+        keep = np.ones(len(start), dtype=bool)
+        keep[rows[1:][same]] = False
+        self.node1s, self.node2s, self.starts, self.ends = node1[keep], node2[keep], start[keep], end[keep]
+        self.changed()
+
+
+    def materialise(self, rows):
+        """
+            A method of ColumnarTemporalEdges.
+
+            Parameter(s):
+            -------------
+            rows : Iterable
+                Row positions in the (consolidated) columns.
+
+            Returns:
+            --------
+            edges : List
+                The corresponding temporal edge objects, reusing materialised objects (and those returned
+                by add) where available.
+        """
+        if self.objects is not None:
+            return [self.objects[i] for i in rows]
+        rows = np.fromiter(rows, dtype=np.int64)
+        labels, nodes, added = self.graph.ids.labels, self.graph.nodes, self.added
+        return [
+            added.get(key) or self._edgeclass(labels[key[0]], labels[key[1]], nodes, key[2], key[3])
+            for key in zip(
+                self.node1s[rows].tolist(), self.node2s[rows].tolist(),
+                self.starts[rows].tolist(), self.ends[rows].tolist()
+            )
+        ]
+
+
+    def select(self, mask):
+        """
+            A method of ColumnarTemporalEdges.
+
+            Parameter(s):
+            -------------
+            mask : numpy.ndarray
+                A boolean mask over the columns.
+
+            Returns:
+            --------
+            subset : TemporalEdges
+                A collection of the selected edges.
+        """
+        return self.subset(self.materialise(np.flatnonzero(mask).tolist()))
+
+
+    def overlapping(self, start, end):
+        """
+            A method of ColumnarTemporalEdges.
+
+            Returns:
+            --------
+            lo, hi : Tuple
+                The slice of rows that may hold edges overlapping [start, end], see IntervalIndex.
+        """
+        self.consolidate()
+        if self.maxends is None:
+            self.maxends = np.maximum.accumulate(self.ends)
+        return np.searchsorted(self.maxends, start, 'left'), np.searchsorted(self.starts, end, 'right')
+
+
+    def window(self, lo, hi, mask):
+        """
+            A method of ColumnarTemporalEdges.
+
+            Returns:
+            --------
+            subset : TemporalEdges
+                A collection of the rows in [lo, hi) selected by 'mask' (a mask over that slice).
+        """
+        return self.subset(self.materialise((lo + np.flatnonzero(mask)).tolist()))
+
+
+    def columns(self):
+        """
+            A method of ColumnarTemporalEdges.
+
+            Returns:
+            --------
+            node_labels, node1s, node2s, starts, ends : Tuple
+                The id -> label list and the node1, node2, start & end columns, ordered by start time.
+        """
+        self.consolidate()
+        return self.graph.ids.labels, self.node1s, self.node2s, self.starts, self.ends
+
+
+    def count(self):
+        self.consolidate()
+        return len(self.starts)
+
+
+    def start_times(self):
+        self.consolidate()
+        return self.starts.tolist()
+
+
+    def end_times(self):
+        self.consolidate()
+        return self.ends.tolist()
+
+
+    def start(self):
+        self.consolidate()
+        return int(self.starts[0])
+
+
+    def end(self):
+        self.consolidate()
+        if self._end is None:
+            self._end = int(self.ends.max())
+        return self._end
+
+
+    def get_edge_by_start(self, time):
+        self.consolidate()
+        lo, hi = np.searchsorted(self.starts, time, 'left'), np.searchsorted(self.starts, time, 'right')
+        return self.subset(self.materialise(range(lo, hi)))
+
+
+    def get_edge_by_end(self, time):
+        self.consolidate()
+        return self.select(self.ends == time)
+
+
+    def get_edge_by_interval(self, interval):
+        self.consolidate()
+        lo, hi = np.searchsorted(self.starts, interval[0], 'left'), np.searchsorted(self.starts, interval[1], 'right')
+        return self.window(lo, hi, self.ends[lo:hi] <= interval[1])
+
+
+    def get_edge_by_overlap(self, interval):
+        lo, hi = self.overlapping(interval[0], interval[1])
+        return self.window(lo, hi, self.ends[lo:hi] >= interval[0])
+
+
+    def get_active_edges(self, time):
+        lo, hi = self.overlapping(time, time)
+        return self.window(lo, hi, self.ends[lo:hi] >= time)
+
+
+    def active(self, mask, time):
+        """
+            A method of ColumnarTemporalEdges.
+
+            Returns:
+            --------
+            mask : numpy.ndarray
+                'mask' restricted to edges active at 'time' (unchanged if time is None).
+        """
+        if time is None:
+            return mask
+        return mask & (self.starts <= time) & (self.ends >= time)
+
+
+    def get_edge_by_node1(self, label, time=None):
+        self.consolidate()
+        return self.select(self.active(self.node1s == self.graph.ids.get(label, -1), time))
+
+
+    def get_edge_by_node2(self, label, time=None):
+        self.consolidate()
+        return self.select(self.active(self.node2s == self.graph.ids.get(label, -1), time))
+
+
+    def get_edge_by_node(self, label, time=None):
+        self.consolidate()
+        nid = self.graph.ids.get(label, -1)
+        return self.select(self.active((self.node1s == nid) | (self.node2s == nid), time))
+
+
+
+class ColumnarTemporalArcs(ColumnarTemporalEdges, TemporalArcs):
+    """
+        A class which represents a collection of temporal arcs, stored as columns.
+    """
+
+    def endpoint_arrays(self, source, sink):
+        return source, sink # directed, order is kept
+
+
+    def get_edge_by_source(self, label, time=None):
+        return self.get_edge_by_node1(label, time)
+
+
+    def get_edge_by_sink(self, label, time=None):
+        return self.get_edge_by_node2(label, time)
@@ -2,6 +2,8 @@
 from overtime.components.graphs import Graph, TemporalGraph
 from overtime.components.nodes import Nodes
 from overtime.components.arcs import Arcs, TemporalArcs
+from overtime.components.columnar import ColumnarTemporalArcs
+from overtime.components.streaming import StreamingTemporalArcs
 
 
 
@@ -58,6 +60,11 @@ class TemporalDiGraph(TemporalGraph):
             A label for the graph.
         data : Input
             A valid Input class/subclass.
+        columnar : Boolean
+            Store the arcs as numpy columns (ColumnarTemporalArcs), creating arc objects on demand.
+        window : Integer
+            Keep only the arcs of the last 'window' time units (StreamingTemporalArcs), for streamed contacts.
+            Takes the place of columnar.
 
         Object Propertie(s):
         --------------------
@@ -81,10 +88,13 @@ class TemporalDiGraph(TemporalGraph):
     _staticclass = DiGraph
 
 
-    def __init__(self, label, data=None):
+    def __init__(self, label, data=None, columnar=False, window=None):
         super().__init__(label)
         self.directed = True
-        self.edges = TemporalArcs(self)
+        if window is not None:
+            self.edges = StreamingTemporalArcs(self, window)
+        else:
+            self.edges = ColumnarTemporalArcs(self) if columnar else TemporalArcs(self)
 
         # if input data is supplied.
         if data is not None:
@@ -129,19 +139,7 @@ class TemporalDiGraph(TemporalGraph):
             Returns:
             --------
             graph : DiGraph
-                A static directed graph.
+                A static directed graph, with an arc for each ordered pair of nodes connected at any time.
+                It is shared between calls until this graph changes, see TemporalGraph.get_underlying_graph.
         """
-        # update the graph label.
-        label = self.label + ' [underlying graph]'
-        # create a static graph.
-        graph = self._staticclass(label)
-        # for each edge in the original graph.
-        for edge in self.edges.set:
-            # add the edge to the snapshot.
-            graph.add_edge(edge.node1.label, edge.node2.label)
-        # for each node in the graph.
-        for node in self.nodes.set:
-            # add the node to the snapshot.
-            graph.add_node(node.label)
-        # return the snapshot.
-        return graph
+        return super().get_underlying_graph()
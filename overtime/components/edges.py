@@ -1,8 +1,137 @@
 
+import copy
+import weakref
+from bisect import bisect_left, bisect_right
+from itertools import accumulate, repeat
+
+import numpy as np
+
 from overtime.components.nodes import Node, Nodes
 
 
 
+def bisect_start(alist, time, right=False):
+    """
+        A helper for time-ordered edge lists.
+
+        Parameter(s):
+        -------------
+        alist : List
+            A list of temporal edge objects, ordered by increasing start time.
+        time : Integer
+            The start time to search for.
+        right : Boolean
+            Return the position after (rather than before) any edges starting at 'time'.
+
+        Returns:
+        --------
+        index : Integer
+            The index of the first edge in the list whose start time is not less than 'time'
+            (greater than 'time' if right is True).
+    """
+    lo, hi = 0, len(alist)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if alist[mid].start < time or (right and alist[mid].start == time):
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+def in_order(alist):
+    """
+        A helper for time-ordered edge lists.
+
+        Parameter(s):
+        -------------
+        alist : List
+            A list of temporal edge objects.
+
+        Returns:
+        --------
+        ordered : Boolean
+            True if the edges are in non-decreasing start time order.
+    """
+    return all(alist[i].start <= alist[i+1].start for i in range(len(alist) - 1))
+
+
+
+class IntervalIndex:
+    """
+        A class to represent an index over the (start, end) times of a time-ordered edge list.
+
+        Parameter(s):
+        -------------
+        alist : List
+            A list of temporal edge objects, ordered by increasing start time.
+
+        Object Propertie(s):
+        --------------------
+        starts : List
+            The start time of each edge, in list order.
+        maxends : List
+            The largest end time among the edges up to and including each position.
+        by_end : List
+            Edge positions ordered by end time.
+        ends : List
+            The end times of the positions in by_end.
+
+        Notes:
+        ------
+        An edge at position i can only be active at a time t if starts[i] <= t and maxends[i] >= t.
+        Both lists are non-decreasing, so the positions to check form one contiguous slice found by binary search.
+
+        See also:
+        ---------
+            TemporalEdges
+    """
+
+    def __init__(self, alist):
+        self.starts = [edge.start for edge in alist]
+        self.maxends = list(accumulate((edge.end for edge in alist), max))
+        self.by_end = sorted(range(len(alist)), key=lambda i: alist[i].end)
+        self.ends = [alist[i].end for i in self.by_end]
+
+
+    def starting(self, start, end=None):
+        """
+            A method of IntervalIndex.
+
+            Returns:
+            --------
+            lo, hi : Tuple
+                The slice of positions whose start time is within [start, end] (end defaults to start).
+        """
+        return bisect_left(self.starts, start), bisect_right(self.starts, start if end is None else end)
+
+
+    def ending(self, time):
+        """
+            A method of IntervalIndex.
+
+            Returns:
+            --------
+            positions : List
+                The positions of edges whose end time is 'time', in list order.
+        """
+        return sorted(self.by_end[bisect_left(self.ends, time):bisect_right(self.ends, time)])
+
+
+    def overlapping(self, start, end):
+        """
+            A method of IntervalIndex.
+
+            Returns:
+            --------
+            lo, hi : Tuple
+                The slice of positions that may hold edges overlapping [start, end].
+                Every overlapping edge is in the slice; edges in it must still be checked for end >= start.
+        """
+        return bisect_left(self.maxends, start), bisect_right(self.starts, end)
+
+
+
 class Edge:
     """
         A class to represent an edge on a graph.
@@ -31,22 +160,54 @@ class Edge:
         graph : Graph
             The graph of which the edge belongs to.
 
+        Notes:
+        ------
+        Edges are slotted and only store their nodes & graph, the label and uid are computed from the node labels.
+
         See also:
         ---------
             TemporalEdge
             Edges
             TemporalEdges
     """
+    __slots__ = ('node1', 'node2', 'graph')
+    directed = False
 
     def __init__(self, node1, node2, nodes):
-        self.label = str(node1) + '-' + str(node2)
-        self.uid = self.label
-        self.directed = False
         self.node1 = nodes.add(node1)
         self.node2 = nodes.add(node2)
         self.graph = nodes.graph
 
-        
+
+    @property
+    def label(self):
+        return self.node1.label + '-' + self.node2.label
+
+
+    @property
+    def uid(self):
+        return self.label
+
+
+    def rebind(self, nodes):
+        """
+            A method of Edge.
+
+            Parameter(s):
+            -------------
+            nodes : Nodes
+                The nodes collection of another graph, holding nodes with the same labels as the edge's nodes.
+
+            Returns:
+            --------
+            edge : Edge
+                A copy of the edge connecting the nodes of that graph.
+        """
+        edge = copy.copy(self)
+        edge.node1, edge.node2, edge.graph = nodes.get(self.node1.label), nodes.get(self.node2.label), nodes.graph
+        return edge
+
+
 
     def print(self):
         """
@@ -99,19 +260,32 @@ class TemporalEdge(Edge):
         duration : Integer
             The duration of the edge.
 
+        Notes:
+        ------
+        The uid and duration are computed from the nodes and times, as for Edge.
+
         See also:
         ---------
             Edge
             Edges
             TemporalEdges
     """
+    __slots__ = ('start', 'end')
 
     def __init__(self, node1, node2, nodes, tstart, tend):
         super().__init__(node1, node2, nodes)
-        self.uid = str(node1) + '-' + str(node2) + '|' + str(tstart)  + '-' + str(tend)
         self.start = int(tstart)
         self.end = int(tend)
-        self.duration = self.end - self.start
+
+
+    @property
+    def uid(self):
+        return self.label + '|' + str(self.start) + '-' + str(self.end)
+
+
+    @property
+    def duration(self):
+        return self.end - self.start
 
     
     def isactive(self, time):
@@ -146,8 +320,16 @@ class Edges:
         --------------------
         set : Set
             The set of edges.
+        index : Dictionary
+            A lookup of the edges in the collection, keyed by uid.
+            Built on first use, then kept up to date as edges are added and removed.
+        adjacency : Dictionary
+            Per-node edge lists under 'node1', 'node2' and 'node' (either connection), keyed by node label.
+            Built on first use, then kept up to date as edges are added and removed.
         graph : Graph
             The graph of which the edges collection belongs to.
+        version : Integer
+            Incremented each time edges are added to or removed from the collection, see Graph.cached.
 
 
         See also:
@@ -157,8 +339,14 @@ class Edges:
             TemporalEdges
     """
 
+    _edgeclass = Edge
+
+
     def __init__(self, graph):
-        self.set = set() # unorderd, unindexed collection of edge objects
+        self.version = 0 # changes with the edges held, see Graph.cached.
+        self.set = set() # unorderd collection of edge objects
+        self._index = None # edge uid -> edge object, see index.
+        self._adjacency = None # per-node edge lists, see adjacency.
         self.graph = graph
 
     
@@ -197,10 +385,272 @@ class Edges:
         # if the edge does not already exist.
         if not self.exists(str(label)):
             # add the edge to the collection.
-            self.set.add(Edge(node_labels[0], node_labels[1], nodes))
+            self.insert(Edge(node_labels[0], node_labels[1], nodes))
         return self.get_edge_by_uid(label)
 
 
+    def add_from(self, edges, nodes):
+        """
+            A method of Edges.
+
+            Parameter(s):
+            -------------
+            edges : Iterable
+                An iterable of (node1, node2) label pairs.
+            nodes : Nodes
+                A valid Nodes class/subclass.
+
+            Returns:
+            --------
+                None, adds each edge that is not already in the collection.
+        """
+        for node1, node2 in edges:
+            node_labels = self.endpoints(node1, node2)
+            # skip edges that already exist, including repeats within 'edges'.
+            if '-'.join(node_labels) not in self.index:
+                self.insert(self._edgeclass(node_labels[0], node_labels[1], nodes))
+
+
+    def endpoints(self, node1, node2):
+        """
+            A method of Edges.
+
+            Parameter(s):
+            -------------
+            node1 : String
+                The label of the node1 connection.
+            node2 : String
+                The label of the node2 connection.
+
+            Returns:
+            --------
+            labels : List
+                The node labels in the order used for the edge's uid (alphabetical, as the edge is undirected).
+        """
+        return sorted([str(node1), str(node2)])
+
+
+    def insert(self, edge):
+        """
+            A method of Edges.
+
+            Parameter(s):
+            -------------
+            edge : Edge
+                An existing edge object.
+
+            Returns:
+            --------
+                None, adds the edge object to the collection and its uid index.
+        """
+        self.version += 1
+        self.set.add(edge)
+        if self._index is not None:
+            self._index[edge.uid] = edge
+        if self._adjacency is not None:
+            self.link(edge)
+
+
+    def discard(self, edge):
+        """
+            A method of Edges.
+
+            Parameter(s):
+            -------------
+            edge : Edge
+                An edge object in the collection.
+
+            Returns:
+            --------
+                None, removes the edge object from the collection and its uid index.
+        """
+        self.version += 1
+        self.set.remove(edge)
+        if self._index is not None:
+            del self._index[edge.uid]
+        if self._adjacency is not None:
+            self.unlink(edge)
+
+
+    def discard_from(self, edges):
+        """
+            A method of Edges.
+
+            Parameter(s):
+            -------------
+            edges : Iterable
+                Distinct edge objects in the collection.
+
+            Returns:
+            --------
+                None, removes the edge objects from the collection in one pass.
+        """
+        edges = list(edges)
+        self.version += 1
+        self.set.difference_update(edges)
+        if self._index is not None:
+            for edge in edges:
+                del self._index[edge.uid]
+        if self._adjacency is not None:
+            self.unlink_from(edges)
+
+
+    def discard_where(self, mask):
+        """
+            A method of Edges.
+
+            Parameter(s):
+            -------------
+            mask : Function/List
+                A function returning True for each edge to remove,
+                or a list of booleans aligned with the collection's set (True to remove).
+                A list is only accepted by ordered (temporal) collections, as a static collection's set is unordered.
+
+            Returns:
+            --------
+                None, removes the selected edges from the collection in one pass.
+        """
+        if callable(mask):
+            self.discard_from([edge for edge in self.set if mask(edge)])
+        elif isinstance(self.set, set):
+            raise TypeError("The edges of a static graph are unordered, a mask must be a function of the edge.")
+        else:
+            self.discard_from([edge for edge, dead in zip(self.set, mask) if dead])
+
+
+    @property
+    def index(self):
+        # the uid lookup is built on first use, then kept up to date by insert & discard.
+        if self._index is None:
+            self._index = {edge.uid: edge for edge in self.set}
+        return self._index
+
+
+    @property
+    def adjacency(self):
+        # the per-node edge lists are built on first use, then kept up to date by link & unlink.
+        if self._adjacency is None:
+            edges = self.set
+            self._adjacency = {'node1': dict(), 'node2': dict(), 'node': dict()}
+            # the collection is already in order, so each edge goes at the end of its lists.
+            for edge in edges:
+                for side, label in self.sides(edge):
+                    self._adjacency[side].setdefault(label, []).append(edge)
+        return self._adjacency
+
+
+    def sides(self, edge):
+        """
+            A method of Edges.
+
+            Parameter(s):
+            -------------
+            edge : Edge
+                An edge object.
+
+            Returns:
+            --------
+            sides : List
+                The (side, node label) adjacency lists the edge belongs in.
+        """
+        sides = [('node1', edge.node1.label), ('node2', edge.node2.label), ('node', edge.node1.label)]
+        # a self loop is only listed once under 'node'.
+        if edge.node2.label != edge.node1.label:
+            sides.append(('node', edge.node2.label))
+        return sides
+
+
+    def link(self, edge):
+        """
+            A method of Edges.
+
+            Parameter(s):
+            -------------
+            edge : Edge
+                An edge object in the collection.
+
+            Returns:
+            --------
+                None, adds the edge to the adjacency lists of its nodes.
+        """
+        for side, label in self.sides(edge):
+            alist = self._adjacency[side].setdefault(label, [])
+            alist.insert(self.position(alist, edge), edge)
+
+
+    def unlink(self, edge):
+        """
+            A method of Edges.
+
+            Parameter(s):
+            -------------
+            edge : Edge
+                An edge object in the collection.
+
+            Returns:
+            --------
+                None, removes the edge from the adjacency lists of its nodes.
+        """
+        for side, label in self.sides(edge):
+            alist = self._adjacency[side][label]
+            alist.remove(edge)
+            if not alist:
+                del self._adjacency[side][label]
+
+
+    def unlink_from(self, edges):
+        """
+            A method of Edges.
+
+            Parameter(s):
+            -------------
+            edges : List
+                Edge objects in the collection.
+
+            Returns:
+            --------
+                None, removes the edges from the adjacency lists of their nodes, filtering each list once.
+        """
+        dead = set(edges)
+        for side, label in {key for edge in edges for key in self.sides(edge)}:
+            alist = [edge for edge in self._adjacency[side][label] if edge not in dead]
+            if alist:
+                self._adjacency[side][label] = alist
+            else:
+                del self._adjacency[side][label]
+
+
+    def position(self, alist, edge):
+        """
+            A method of Edges.
+
+            Returns:
+            --------
+            index : Integer
+                Where to insert 'edge' in the adjacency list 'alist' (at the end, as edges are unordered).
+        """
+        return len(alist)
+
+
+    def incident(self, label, side='node'):
+        """
+            A method of Edges.
+
+            Parameter(s):
+            -------------
+            label : String
+                The label of a node.
+            side : String
+                'node1', 'node2' or 'node' (either connection).
+
+            Returns:
+            --------
+            edges : List
+                The node's adjacency list. This is the list held by the collection, it should not be modified.
+        """
+        return self.adjacency[side].get(label, [])
+
+
     def remove(self, label):
         """
             A method of Nodes.
@@ -220,8 +670,7 @@ class Edges:
         if not self.exists(str(label)):
             print('Error: {} not found in graph {}.'.format(label, self.graph.label))
         else:
-            self.set.remove(self.get_edge_by_uid(label))
-            print('{} removed from graph {}.'.format(label, self.graph.label))
+            self.discard(self.get_edge_by_uid(str(label)))
 
 
     def subset(self, alist):
@@ -239,8 +688,8 @@ class Edges:
                 The corresponding Edges collection.
         """
         subset = Edges(self.graph) # the subset is linked to the original graph.
-        for edge in alist:
-            subset.set.add(edge)
+        # the subset's uid lookup & adjacency lists are only built if it is queried.
+        subset.set = set(alist)
         return subset
 
     
@@ -258,7 +707,7 @@ class Edges:
             edge : Edge
                 The corresponding edge object.
         """
-        return next((edge for edge in self.set if edge.uid == uid), None)
+        return self.index.get(uid)
 
 
     def get_edge_by_label(self, label):
@@ -292,7 +741,7 @@ class Edges:
             subset : Edges
                 The corresponding collection of edges connected to node 'label'.
         """
-        return self.subset(edge for edge in self.set if edge.node1.label == label or edge.node2.label == label)
+        return self.subset(self.incident(label, 'node'))
 
 
     def get_edge_by_node1(self, label):
@@ -309,7 +758,7 @@ class Edges:
             subset : Edges
                 The corresponding collection of edges connected to node1 'label'.
         """
-        return self.subset([edge for edge in self.set if edge.node1.label == label])
+        return self.subset(self.incident(label, 'node1'))
 
 
     def get_edge_by_node2(self, label):
@@ -326,7 +775,7 @@ class Edges:
             subset : Edges
                 The corresponding collection of edges connected to node2 'label'.
         """
-        return self.subset([edge for edge in self.set if edge.node2.label == label])
+        return self.subset(self.incident(label, 'node2'))
 
 
     def exists(self, uid):
@@ -343,7 +792,7 @@ class Edges:
             exists : Boolean
                 True if an edge with unique label 'uid' exists in the collection.
         """
-        return True if self.get_edge_by_uid(uid) is not None else False
+        return uid in self.index
 
     
     def count(self):
@@ -424,6 +873,30 @@ class TemporalEdges(Edges):
             Inherited from Edges.
         set : Set
             The list of edges, ordered by edge start time.
+            Out of order additions are sorted in one pass when the list is next read.
+        index : Dictionary
+            Inherited from Edges.
+        ordered : Boolean
+            Indicates whether the underlying list is currently in start time order.
+
+        Notes:
+        ------
+        The smallest start & largest end times are kept as edges are added, and only found again by a
+        pass over the edges after the edge holding one of them is removed, see start & end.
+
+        A clone shares the edge list of the collection it was made from until the clone is first used, when
+        it makes its own copies of the edges, joining its own graph's nodes. Removals from the original are
+        recorded as tombstones and dropped when its list is next read, an addition gives it its own list
+        first. See clone.
+
+        Batch removals (discard_from) are always recorded as tombstones, the list is compacted once when next read.
+
+        The query methods (get_edge_by_node, get_active_edges, get_edge_by_interval, ...) return views: collections
+        whose edges are only taken from this collection when the view is first used (read, counted or changed).
+        Querying a view that has not been used yet adds to its filter, so a chain such as
+        edges.get_edge_by_source(x).get_edge_by_interval(i) makes one pass over x's edges and builds no
+        intermediate list. A view holds the edges of its parent collection at the time the view was made:
+        before the parent changes (edges added or removed) it hands its unused views their edges, see resolve_views.
 
 
         See also:
@@ -433,27 +906,234 @@ class TemporalEdges(Edges):
             Edges
     """
 
+    _edgeclass = TemporalEdge
+
+
     def __init__(self, graph):
+        self._views = [] # weak references to the unused views taken of this collection, see resolve_views.
         super().__init__(graph)
         self.set = [] # ordered (by time), indexed collection of edge objects
 
 
-    def add(self, node1, node2, nodes, tstart, tend=None):
+    @property
+    def set(self):
+        # a view takes its edges from the parent collection when it is first used.
+        if self._view is not None:
+            self.realise()
+        # a clone makes its own edge objects when it is first used.
+        if self._rebind:
+            self.compact()
+        # removed edges (tombstones) are dropped before the list is handed out.
+        if self._dead:
+            self.compact()
+        # sort any out of order additions before the list is handed out.
+        if not self.ordered:
+            self._set = self.sort(self._set)
+            self.ordered = True
+        return self._set
+
+
+    @set.setter
+    def set(self, alist):
+        if self._views:
+            self.resolve_views()
+        self.version += 1
+        self._view, self._rebind = None, False
+        self._dead, self._shared = set(), False
+        self._set = list(alist)
+        self._intervals, self._index = None, None
+        self._start, self._end = None, None # time bounds, found on first use.
+        self._adjacency, self._node_intervals = None, dict()
+        self._groups = None # label -> (start, end) pairs, see group_by_label.
+        # only flag the list for sorting if it is not already in start time order.
+        self.ordered = in_order(self._set)
+
+
+    def __getstate__(self):
+        # views are resolved before copying or pickling, so a copy does not refer back to the parent.
+        if self._view is not None:
+            self.realise()
+        # the views taken of this collection stay with it.
+        state = dict(self.__dict__)
+        state['_views'] = []
+        return state
+
+
+    @property
+    def index(self):
+        alist = self.set
+        # the uid lookup is built on first use, then kept up to date by insert & discard.
+        if self._index is None:
+            self._index = {edge.uid: edge for edge in alist}
+        return self._index
+
+
+    def get_edge_by_uid(self, uid):
         """
             A method of TemporalEdges.
 
             Parameter(s):
             -------------
-            node1 : String
-                The label of the node1 connection.
-            node2 : String
-                The label of the node2 connection.
-            nodes : Nodes
-                A valid Nodes class/subclass.
-            tstart : Integer
-                The start time of the temporal edge.
-            tend : Integer
-                The end time of the temporal edge.
+            uid : String
+                The unique label of an edge.
+
+            Returns:
+            --------
+            edge : TemporalEdge
+                The corresponding edge object.
+        """
+        if self._index is None:
+            return self.index.get(uid)
+        # a built index is current without reading (sorting or compacting) the edge list,
+        # removed edges stay in it until the list is next read, see discard.
+        edge = self._index.get(uid)
+        return None if edge in self._dead else edge
+
+
+    def exists(self, uid):
+        """
+            A method of TemporalEdges.
+
+            Parameter(s):
+            -------------
+            uid : String
+                The unique label of an edge.
+
+            Returns:
+            --------
+            exists : Boolean
+                True if an edge with unique label 'uid' exists in the collection.
+        """
+        return self.get_edge_by_uid(uid) is not None
+
+
+    def clone(self, graph):
+        """
+            A method of TemporalEdges.
+
+            Parameter(s):
+            -------------
+            graph : Graph
+                The graph the clone belongs to.
+
+            Returns:
+            --------
+            clone : TemporalEdges
+                A copy of the collection that shares its edge list until the clone is first used (read or changed).
+                The clone then copies the edges onto the nodes of 'graph' (see Edge.rebind), so changes made
+                through a clone's edges, such as to their nodes' data, never reach this collection's nodes.
+        """
+        alist = self.set
+        clone = self.subset([])
+        clone.graph = graph
+        clone._set, clone._rebind = alist, True
+        clone._start, clone._end = self._start, self._end
+        # this collection now copies before changing the list or index in place.
+        self._shared, clone._shared = True, True
+        return clone
+
+
+    def compact(self):
+        """
+            A method of TemporalEdges.
+
+            Returns:
+            --------
+                None, gives the collection its own edge list & uid index, dropping removed edges (tombstones).
+                A clone also gets its own edge objects, see clone.
+        """
+        dead = self._dead
+        if self._rebind:
+            nodes = self.graph.nodes
+            self._set = [edge.rebind(nodes) for edge in self._set if edge not in dead]
+            self._index, self._intervals, self._rebind = None, None, False
+            self._adjacency, self._node_intervals = None, dict()
+        else:
+            self._set = [edge for edge in self._set if edge not in dead]
+            if self._index is not None:
+                self._index = {uid: edge for uid, edge in self._index.items() if edge not in dead}
+        self._dead, self._shared = set(), False
+
+
+    def view(self, candidates, predicate):
+        """
+            A method of TemporalEdges.
+
+            Parameter(s):
+            -------------
+            candidates : Function
+                Returns the edges of this collection that may be selected, in start time order.
+            predicate : Function
+                Returns True for each selected edge, it must hold for exactly the selected edges.
+
+            Returns:
+            --------
+            subset : TemporalEdges
+                A view of the selected edges, they are found when the view is first used
+                or when the collection the candidates come from next changes, whichever is first.
+        """
+        source = self
+        if self._view is not None:
+            # this collection is itself an unused view, filter its candidates by both predicates instead.
+            candidates, first, second, source = self._view[0], self._view[1], predicate, self._view[2]
+            predicate = lambda edge: first(edge) and second(edge)
+        subset = self.subset([])
+        subset._view = (candidates, predicate, source)
+        views = source._views
+        views.append(weakref.ref(subset))
+        # views that are gone or already used are dropped each time the list reaches a power of two.
+        if len(views) >= 64 and not len(views) & (len(views) - 1):
+            views[:] = [view for view in views if view() is not None and view()._view is not None]
+        return subset
+
+
+    def resolve_views(self):
+        """
+            A method of TemporalEdges.
+
+            Returns:
+            --------
+                None, hands the unused views taken of this collection their edges, called before it changes
+                so that each view holds the edges of the collection as they were when the view was made.
+        """
+        views, self._views = self._views, []
+        for view in views:
+            view = view()
+            if view is not None and view._view is not None:
+                view.realise()
+
+
+    def realise(self):
+        """
+            A method of TemporalEdges.
+
+            Returns:
+            --------
+                None, takes the edges of a view from its parent collection.
+        """
+        candidates, predicate = self._view[:2]
+        self._view = None
+        # the candidates come from a time-ordered list, so the selected edges are in order.
+        self._set = [edge for edge in candidates() if predicate(edge)]
+        self.ordered = True
+
+
+    def add(self, node1, node2, nodes, tstart, tend=None):
+        """
+            A method of TemporalEdges.
+
+            Parameter(s):
+            -------------
+            node1 : String
+                The label of the node1 connection.
+            node2 : String
+                The label of the node2 connection.
+            nodes : Nodes
+                A valid Nodes class/subclass.
+            tstart : Integer
+                The start time of the temporal edge.
+            tend : Integer
+                The end time of the temporal edge.
 
             Returns:
             --------
@@ -463,6 +1143,7 @@ class TemporalEdges(Edges):
         # if no end time is specified.
         if tend is None:
             tend = int(tstart) + 0 # default duration of 0.
+        tstart, tend = int(tstart), int(tend) # as stored on the edge, see TemporalEdge.uid.
         node_labels = sorted([str(node1),str(node2)])
         uid = '-'.join(node_labels) + '|' + str(tstart) + '-' + str(tend) # uid is alphabetically sorted.
         # if an edge with this uid does not exist in the collection.
@@ -470,12 +1151,391 @@ class TemporalEdges(Edges):
             # create the temporal edge.
             edge = TemporalEdge(node_labels[0], node_labels[1], nodes, tstart, tend)
             # add the new edge to the collection.
-            self.set.append(edge)
-            # sort the collection.
-            self.set = self.sort(self.set)
+            self.insert(edge)
+            # returned even if the collection drops it at once, see StreamingTemporalEdges.
+            return edge
         return self.get_edge_by_uid(uid)
 
 
+    def add_from(self, edges, nodes):
+        """
+            A method of TemporalEdges.
+
+            Parameter(s):
+            -------------
+            edges : Iterable
+                An iterable of (node1, node2, tstart, tend) tuples, tend may be None.
+            nodes : Nodes
+                A valid Nodes class/subclass.
+
+            Returns:
+            --------
+            added : List
+                The new temporal edge objects, edges already in the collection are skipped.
+                The new edges are appended as one block and sorted once, when the collection is next read.
+        """
+        if self._views:
+            self.resolve_views()
+        if self._view is not None:
+            self.realise()
+        if self._shared:
+            self.compact()
+        self.version += 1
+        added = []
+        for node1, node2, tstart, tend in edges:
+            # if no end time is specified.
+            if tend is None:
+                tend = int(tstart) + 0 # default duration of 0.
+            tstart, tend = int(tstart), int(tend)
+            node_labels = self.endpoints(node1, node2)
+            uid = '-'.join(node_labels) + '|' + str(tstart) + '-' + str(tend)
+            # skip edges that already exist, including repeats within 'edges'.
+            if uid not in self.index:
+                edge = self._edgeclass(node_labels[0], node_labels[1], nodes, tstart, tend)
+                self.index[edge.uid] = edge
+                added.append(edge)
+        # the list stays ordered only if the new block is in order and follows the current last edge.
+        self.ordered = self.ordered and in_order(self._set[-1:] + added)
+        self._set.extend(added)
+        self._intervals = None
+        self.group(added)
+        if added:
+            self.extend_bounds(min(edge.start for edge in added), max(edge.end for edge in added))
+        # the adjacency lists are rebuilt on next use rather than updated edge by edge.
+        self._adjacency, self._node_intervals = None, dict()
+        return added
+
+
+    def add_arrays(self, node1, node2, tstart, tend, nodes):
+        """
+            A method of TemporalEdges.
+
+            Parameter(s):
+            -------------
+            node1 : List/Array
+                The node1 labels of the edges.
+            node2 : List/Array
+                The node2 labels of the edges.
+            tstart : List/Array
+                The start times of the edges.
+            tend : List/Array
+                The end times of the edges, or None for a duration of 0.
+            nodes : Nodes
+                A valid Nodes class/subclass.
+
+            Returns:
+            --------
+                None, adds the edges through add_from.
+        """
+        self.add_from(zip(node1, node2, tstart, repeat(None) if tend is None else tend), nodes)
+
+
+    def columns(self):
+        """
+            A method of TemporalEdges.
+
+            Returns:
+            --------
+            node_labels, node1s, node2s, starts, ends : Tuple
+                The graph's list mapping integer node ids to labels (graph.ids.labels), then int32 node1 & node2
+                id arrays and int64 start & end time arrays, ordered by start time.
+        """
+        ids = self.graph.ids
+        node1s = [ids.intern(edge.node1.label) for edge in self.set]
+        node2s = [ids.intern(edge.node2.label) for edge in self.set]
+        return (
+            ids.labels,
+            np.array(node1s, dtype=np.int32),
+            np.array(node2s, dtype=np.int32),
+            np.array(self.start_times(), dtype=np.int64),
+            np.array(self.end_times(), dtype=np.int64)
+        )
+
+
+    def insert(self, edge):
+        """
+            A method of TemporalEdges.
+
+            Parameter(s):
+            -------------
+            edge : TemporalEdge
+                An existing temporal edge object.
+
+            Returns:
+            --------
+                None, adds the edge object to the collection and its uid index.
+        """
+        if self._views:
+            self.resolve_views()
+        if self._view is not None:
+            self.realise()
+        if self._shared:
+            self.compact()
+        self.version += 1
+        # an edge starting before the current last edge puts the list out of order.
+        if self.ordered and self._set and edge.start < self._set[-1].start:
+            self.ordered = False
+        self._set.append(edge)
+        self._intervals = None
+        self.group((edge,))
+        self.extend_bounds(edge.start, edge.end)
+        if self._index is not None:
+            self._index[edge.uid] = edge
+        if self._adjacency is not None:
+            self.link(edge)
+
+
+    def discard(self, edge):
+        """
+            A method of TemporalEdges.
+
+            Parameter(s):
+            -------------
+            edge : TemporalEdge
+                A temporal edge object in the collection.
+
+            Returns:
+            --------
+                None, removes the edge object from the collection and its uid index.
+        """
+        if self._views:
+            self.resolve_views()
+        self.version += 1
+        if self._shared:
+            # the list & uid index are shared with a clone, record the removal instead of changing them.
+            self._dead.add(edge)
+        else:
+            # binary search for the first edge with the same start time, then step over any ties.
+            i = bisect_start(self.set, edge.start)
+            while self.set[i] is not edge:
+                i += 1
+            del self.set[i]
+            if self._index is not None:
+                del self._index[edge.uid]
+        self._intervals, self._groups = None, None
+        # a bound held by the removed edge is found again when next asked for.
+        if edge.start == self._start:
+            self._start = None
+        if edge.end == self._end:
+            self._end = None
+        if self._adjacency is not None:
+            self.unlink(edge)
+
+
+    def discard_from(self, edges):
+        """
+            A method of TemporalEdges.
+
+            Parameter(s):
+            -------------
+            edges : Iterable
+                Distinct temporal edge objects in the collection.
+
+            Returns:
+            --------
+                None, records the edges as removed (tombstones), the edge list is compacted when next read.
+        """
+        if self._views:
+            self.resolve_views()
+        edges = list(edges)
+        if self._view is not None:
+            self.realise()
+        self.version += 1
+        self._dead.update(edges)
+        self._intervals, self._groups = None, None
+        for edge in edges:
+            if edge.start == self._start:
+                self._start = None
+            if edge.end == self._end:
+                self._end = None
+        if self._adjacency is not None:
+            self.unlink_from(edges)
+
+
+    def extend_bounds(self, start, end):
+        """
+            A method of TemporalEdges.
+
+            Parameter(s):
+            -------------
+            start : Integer
+                The start time of added edges.
+            end : Integer
+                The end time of added edges.
+
+            Returns:
+            --------
+                None, widens the known time bounds of the collection to include [start, end].
+        """
+        if self._start is not None and start < self._start:
+            self._start = start
+        if self._end is not None and end > self._end:
+            self._end = end
+
+
+    def link(self, edge):
+        """
+            A method of TemporalEdges.
+
+            Parameter(s):
+            -------------
+            edge : TemporalEdge
+                A temporal edge object in the collection.
+
+            Returns:
+            --------
+                None, inserts the edge into its nodes' adjacency lists, keeping them in start time order.
+        """
+        super().link(edge)
+        for key in self.sides(edge):
+            self._node_intervals.pop(key, None)
+
+
+    def unlink(self, edge):
+        """
+            A method of TemporalEdges.
+
+            Parameter(s):
+            -------------
+            edge : TemporalEdge
+                A temporal edge object in the collection.
+
+            Returns:
+            --------
+                None, removes the edge from its nodes' adjacency lists.
+        """
+        super().unlink(edge)
+        for key in self.sides(edge):
+            self._node_intervals.pop(key, None)
+
+
+    def unlink_from(self, edges):
+        """
+            A method of TemporalEdges.
+
+            Parameter(s):
+            -------------
+            edges : List
+                Temporal edge objects in the collection.
+
+            Returns:
+            --------
+                None, removes the edges from their nodes' adjacency lists.
+        """
+        super().unlink_from(edges)
+        for edge in edges:
+            for key in self.sides(edge):
+                self._node_intervals.pop(key, None)
+
+
+    def position(self, alist, edge):
+        """
+            A method of TemporalEdges.
+
+            Returns:
+            --------
+            index : Integer
+                Where to insert 'edge' in the adjacency list 'alist', after any edges starting at or before it.
+        """
+        return bisect_start(alist, edge.start, right=True)
+
+
+    def incident(self, label, side='node', time=None):
+        """
+            A method of TemporalEdges.
+
+            Parameter(s):
+            -------------
+            label : String
+                The label of a node.
+            side : String
+                'node1', 'node2' or 'node' (either connection).
+            time : Integer
+                Only return edges active at this time (optional).
+
+            Returns:
+            --------
+            edges : List
+                The node's adjacency list, ordered by start time. Without a time this is the list held by
+                the collection, it should not be modified.
+        """
+        alist = self.adjacency[side].get(label, [])
+        if time is None or not alist:
+            return alist
+        # each node's list gets its own interval index, built on first use.
+        intervals = self._node_intervals.get((side, label))
+        if intervals is None:
+            intervals = self._node_intervals[(side, label)] = IntervalIndex(alist)
+        lo, hi = intervals.overlapping(time, time)
+        return [edge for edge in alist[lo:hi] if edge.end >= time]
+
+
+    def get_edge_by_node(self, label, time=None):
+        """
+            A method of TemporalEdges.
+
+            Parameter(s):
+            -------------
+            label : String
+                The label of a node.
+            time : Integer
+                Only return edges active at this time (optional).
+
+            Returns:
+            --------
+            subset : TemporalEdges
+                The corresponding collection of edges connected to node 'label'.
+        """
+        return self.view(
+            lambda: self.incident(label, 'node', time),
+            lambda edge: label in (edge.node1.label, edge.node2.label) and (time is None or edge.isactive(time))
+        )
+
+
+    def get_edge_by_node1(self, label, time=None):
+        """
+            A method of TemporalEdges.
+
+            Parameter(s):
+            -------------
+            label : String
+                The label of a node.
+            time : Integer
+                Only return edges active at this time (optional).
+
+            Returns:
+            --------
+            subset : TemporalEdges
+                The corresponding collection of edges connected to node1 'label'.
+        """
+        return self.view(
+            lambda: self.incident(label, 'node1', time),
+            lambda edge: edge.node1.label == label and (time is None or edge.isactive(time))
+        )
+
+
+    def get_edge_by_node2(self, label, time=None):
+        """
+            A method of TemporalEdges.
+
+            Parameter(s):
+            -------------
+            label : String
+                The label of a node.
+            time : Integer
+                Only return edges active at this time (optional).
+
+            Returns:
+            --------
+            subset : TemporalEdges
+                The corresponding collection of edges connected to node2 'label'.
+        """
+        return self.view(
+            lambda: self.incident(label, 'node2', time),
+            lambda edge: edge.node2.label == label and (time is None or edge.isactive(time))
+        )
+
+
     def subset(self, alist):
         """
             A method of TemporalEdges.
@@ -491,10 +1551,8 @@ class TemporalEdges(Edges):
                 The corresponding TemporalEdges collection.
         """
         subset = TemporalEdges(self.graph)
-        for edge in alist:
-            subset.set.append(edge)
-        # sort the subset.
-        subset.set = subset.sort(subset.set)
+        # the subset is only sorted if the edges are not already in order.
+        subset.set = alist
         return subset
 
 
@@ -535,7 +1593,10 @@ class TemporalEdges(Edges):
             subset : TemporalEdges
                 The corresponding collection of edges with start time 'time'.
         """
-        return self.subset([edge for edge in self.set if edge.start == time])
+        def candidates():
+            lo, hi = self.intervals.starting(time)
+            return self.set[lo:hi]
+        return self.view(candidates, lambda edge: edge.start == time)
 
     
     def get_edge_by_end(self, time):
@@ -552,7 +1613,10 @@ class TemporalEdges(Edges):
             subset : TemporalEdges
                 The corresponding collection of edges with end time 'time'.
         """
-        return self.subset([edge for edge in self.set if edge.end == time])
+        def candidates():
+            alist = self.set
+            return [alist[i] for i in self.intervals.ending(time)]
+        return self.view(candidates, lambda edge: edge.end == time)
 
 
     def get_edge_by_interval(self, interval):
@@ -569,7 +1633,30 @@ class TemporalEdges(Edges):
             subset : TemporalEdges
                 The corresponding collection of edges with durations within the interval specified.
         """
-        return self.subset([edge for edge in self.set if edge.start >= interval[0] and edge.end <= interval[1]])
+        def candidates():
+            lo, hi = self.intervals.starting(interval[0], interval[1])
+            return self.set[lo:hi]
+        return self.view(candidates, lambda edge: interval[0] <= edge.start and edge.end <= interval[1])
+
+
+    def get_edge_by_overlap(self, interval):
+        """
+            A method of TemporalEdges.
+
+            Parameter(s):
+            -------------
+            interval : List/Tuple
+                A start-end time pair, for example (3,5).
+
+            Returns:
+            --------
+            subset : TemporalEdges
+                The corresponding collection of edges which are active at some time within the interval.
+        """
+        def candidates():
+            lo, hi = self.intervals.overlapping(interval[0], interval[1])
+            return self.set[lo:hi]
+        return self.view(candidates, lambda edge: edge.start <= interval[1] and edge.end >= interval[0])
 
 
     def get_active_edges(self, time):
@@ -586,7 +1673,18 @@ class TemporalEdges(Edges):
             subset : TemporalEdges
                 The corresponding collection of edges which are active at time 'time'.
         """
-        return self.subset(edge for edge in self.set if edge.isactive(time))
+        def candidates():
+            lo, hi = self.intervals.overlapping(time, time)
+            return self.set[lo:hi]
+        return self.view(candidates, lambda edge: edge.isactive(time))
+
+
+    @property
+    def intervals(self):
+        # the interval index is built on first use after the collection changes.
+        if self._intervals is None:
+            self._intervals = IntervalIndex(self.set)
+        return self._intervals
 
 
     def ulabels(self):
@@ -596,9 +1694,55 @@ class TemporalEdges(Edges):
             Returns:
             --------
             labels : List
-                A sorted list of unique edge labels in the collection.
+                A list of unique edge labels in the collection, in order of their first start time.
+        """
+        return list(self.group_by_label())
+
+
+    def group_by_label(self):
+        """
+            A method of TemporalEdges.
+
+            Returns:
+            --------
+            groups : Dict
+                Maps each unique edge label (in order of its first start time, as ulabels) to a list of the
+                (start, end) times of its edges, in start time order. This is the dictionary held by the
+                collection, it should not be modified.
+
+            Notes:
+            ------
+            The groups are found in one pass over the edges on first use, then extended as edges are added
+            in start time order. Removing edges, or adding them out of order, drops them until next used.
+        """
+        if self._groups is None:
+            groups = dict()
+            for edge in self.set:
+                groups.setdefault(edge.label, []).append((edge.start, edge.end))
+            self._groups = groups
+        return self._groups
+
+
+    def group(self, edges):
+        """
+            A method of TemporalEdges.
+
+            Parameter(s):
+            -------------
+            edges : List
+                Temporal edge objects just added to the end of the collection.
+
+            Returns:
+            --------
+                None, adds the edges' times to the label groups, or drops the groups if the edges are out of order.
         """
-        return sorted(set([label for label in self.labels()]), key=lambda x:self.labels().index(x))
+        if self._groups is None:
+            return
+        if not self.ordered:
+            self._groups = None
+            return
+        for edge in edges:
+            self._groups.setdefault(edge.label, []).append((edge.start, edge.end))
         
 
     def start_times(self):
@@ -634,7 +1778,9 @@ class TemporalEdges(Edges):
             start : Integer
                 The smallest start time of the collection.
         """
-        return self.set[0].start
+        if self._start is None:
+            self._start = self.set[0].start
+        return self._start
     
 
     def end(self):
@@ -646,8 +1792,9 @@ class TemporalEdges(Edges):
             end : Integer
                 The largest end time of the collection.
         """
-        ends = self.sort(self.set, 'end')
-        return ends[-1].end
+        if self._end is None:
+            self._end = max(edge.end for edge in self.set)
+        return self._end
 
 
     def timespan(self):
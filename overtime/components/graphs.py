@@ -1,9 +1,11 @@
 
-import copy 
+import copy
 
 import overtime
-from overtime.components.nodes import Nodes
+from overtime.components.nodes import NodeIds, Nodes
 from overtime.components.edges import Edges, TemporalEdges
+from overtime.components.columnar import ColumnarTemporalEdges
+from overtime.components.streaming import StreamingTemporalEdges
 
 
 
@@ -26,10 +28,20 @@ class Graph:
             Indicates whether the is graph directed, or undirected.
         static : Boolean
             Indicates whether the graph is static, or not (temporal).
+        ids : NodeIds
+            The table of integer ids given to the graph's node labels.
         nodes : Nodes
             A nodes collection representing all nodes in the graph.
         edges : Edges
             An edges collection representing all edges in the graph.
+        version : Integer
+            Incremented each time nodes or edges are added or removed through the graph's methods.
+
+        Notes:
+        ------
+        Results derived from the graph can be kept with cached, they are dropped when the version changes,
+        when the nodes or edges collection is replaced, or when either collection's own version changes
+        (nodes or edges added or removed on the collection directly, e.g. graph.edges.add(...)).
 
         See also:
         ---------
@@ -42,6 +54,10 @@ class Graph:
         self.label = label
         self.directed = False
         self.static = True
+        self.version = 0
+        self._cache = dict() # key -> result derived from the current version, see cached.
+        self._state = None # the version & collections the cached results were derived from.
+        self.ids = NodeIds()
         self.nodes = Nodes(self)
         self.edges = Edges(self)
 
@@ -64,10 +80,8 @@ class Graph:
             --------
                 None, adds edges & nodes to the graph.
         """
-        # for each edge in data['edges'].
-        for index, edge in data.data['edges'].items():
-            # add the edge using the add_edge method.
-            self.add_edge(edge['node1'], edge['node2'])
+        # add every edge in data['edges'] in one bulk pass.
+        self.add_edges_from((edge['node1'], edge['node2']) for edge in data.data['edges'].values())
         # for each node in data['nodes'].
         for index, node in data.data['nodes'].items():
             self.add_node(node)
@@ -86,6 +100,7 @@ class Graph:
             node : Node
                 The corresponding node object.
         """
+        self.modified()
         return self.nodes.add(label)
 
 
@@ -105,9 +120,55 @@ class Graph:
             edge : Edge
                 The corresponding edge object.
         """
+        self.modified()
         return self.edges.add(node1, node2, self.nodes)
 
 
+    def add_edges_from(self, edges):
+        """
+            A method of Graph.
+
+            Parameter(s):
+            -------------
+            edges : Iterable
+                An iterable of (node1, node2) label pairs.
+
+            Returns:
+            --------
+                None, adds the edges (and any new nodes) to the graph in a single pass.
+        """
+        self.modified()
+        self.edges.add_from(edges, self.nodes)
+
+
+    @classmethod
+    def from_arrays(cls, label, node1, node2):
+        """
+            A class method of Graph.
+
+            Parameter(s):
+            -------------
+            label : String
+                A label for the graph.
+            node1 : List/Array
+                The node1 labels of the edges.
+            node2 : List/Array
+                The node2 labels of the edges, aligned with node1.
+
+            Returns:
+            --------
+            graph : Graph
+                A graph of this class, built with a single bulk insert.
+
+            Example(s):
+            -----------
+                graph = Graph.from_arrays('static_network', ['a', 'b'], ['b', 'c'])
+        """
+        graph = cls(label)
+        graph.add_edges_from(zip(node1, node2))
+        return graph
+
+
     def remove_node(self, label):
         """
             A method of Graph.
@@ -121,14 +182,15 @@ class Graph:
             --------
             None, removes the corresponding node and any connected edges (if the node exists in the graph).
         """
+        # the connected edges are found first, columnar edges need the node to create their objects.
+        alist = self.edges.get_edge_by_node(str(label)).set if self.nodes.exists(str(label)) else []
         # call nodes.remove (remove the node, returns true/false if successful/unsuccessful).
         flag = self.nodes.remove(label)
         # if the node was removed.
         if flag:
-            # for each edge connected to the node with label 'label'.
-            for edge in self.edges.get_edge_by_node(label).set:
-                # call edges.remove (remove the edge).
-                self.edges.remove(edge.uid)
+            self.modified()
+            # remove every edge connected to the node with label 'label' in one pass.
+            self.edges.discard_from(alist)
 
 
     def remove_edge(self, uid):
@@ -144,12 +206,96 @@ class Graph:
             --------
             None, removes the corresponding edge.
         """
+        self.modified()
         self.edges.remove(uid)
 
 
+    def remove_edges(self, uids):
+        """
+            A method of Graph.
+
+            Parameter(s):
+            -------------
+            uids : Iterable
+                The labels of the edges to be removed.
+
+            Returns:
+            --------
+            None, removes the corresponding edges in one pass (labels not found in the graph are skipped).
+        """
+        self.modified()
+        edges = (self.edges.get_edge_by_uid(str(uid)) for uid in dict.fromkeys(uids))
+        self.edges.discard_from([edge for edge in edges if edge is not None])
+
+
+    def remove_edges_where(self, mask):
+        """
+            A method of Graph.
+
+            Parameter(s):
+            -------------
+            mask : Function/List
+                A function returning True for each edge to be removed,
+                or a list of booleans aligned with the graph's edges (True to remove).
+                A list is only accepted by temporal graphs, whose edges are in start time order,
+                a static graph raises a TypeError.
+
+            Returns:
+            --------
+            None, removes the selected edges in one pass.
+        """
+        self.edges.discard_where(mask)
+        self.modified()
+
+
+    def modified(self):
+        """
+            A method of Graph.
+
+            Returns:
+            --------
+            None, increments the graph's version and drops the results cached for the previous version.
+        """
+        self.version += 1
+        self._cache.clear()
+
+
+    def cached(self, key, function):
+        """
+            A method of Graph.
+
+            Parameter(s):
+            -------------
+            key : Hashable
+                Identifies the result, for example a name and the parameters it was computed with.
+            function : Function
+                Computes the result from the graph, called without arguments.
+
+            Returns:
+            --------
+            result : Object
+                The result for the graph's current version, computed on first use and shared by later calls.
+                It should not be modified.
+
+            Example(s):
+            -----------
+                reachability = graph.cached(('reachability', 'a'), lambda: calculate_reachability(graph, 'a'))
+        """
+        # collections changed directly (or replaced) since the results were cached also drop them.
+        state = (self.version, self.nodes, self.nodes.version, self.edges, self.edges.version)
+        if state != self._state:
+            self._cache.clear()
+            self._state = state
+        if key not in self._cache:
+            self._cache[key] = function()
+        return self._cache[key]
+
+
     def get_node_connections(self, label):
         node = self.nodes.get(label)
         graph = self.__class__(label + '-Network')
+        # the connections hold this graph's nodes & edges, so the new graph keeps this graph's node ids.
+        graph.ids.ids, graph.ids.labels = dict(self.ids.ids), list(self.ids.labels)
         graph.edges = node.nodeof() # do this before updating node's graph.
         graph.nodes = node.neighbours()
         graph.add_node(label)
@@ -195,6 +341,11 @@ class TemporalGraph(Graph):
             A label for the graph.
         data : Input
             A valid Input class/subclass.
+        columnar : Boolean
+            Store the edges as numpy columns (ColumnarTemporalEdges), creating edge objects on demand.
+        window : Integer
+            Keep only the edges of the last 'window' time units (StreamingTemporalEdges), for streamed contacts.
+            Takes the place of columnar.
 
         Object Propertie(s):
         --------------------
@@ -218,10 +369,13 @@ class TemporalGraph(Graph):
     _staticclass = Graph
 
 
-    def __init__(self, label, data=None):
+    def __init__(self, label, data=None, columnar=False, window=None):
         super().__init__(label)
         self.static = False
-        self.edges = TemporalEdges(self)
+        if window is not None:
+            self.edges = StreamingTemporalEdges(self, window)
+        else:
+            self.edges = ColumnarTemporalEdges(self) if columnar else TemporalEdges(self)
 
         # if input data is supplied.
         if data is not None:
@@ -242,11 +396,11 @@ class TemporalGraph(Graph):
             --------
                 None, adds edges & nodes to the graph.
         """
-        # for each edge in data['edges'].
-        for index, edge in data.data['edges'].items():
-            # add the edge using the add_edge method.
-            self.add_edge(edge['node1'], edge['node2'], edge['tstart'], edge['tend'])
-         # for each node in data['nodes'].
+        # add every edge in data['edges'] in one bulk pass (deduplicated and sorted once).
+        self.add_edges_from(
+            (edge['node1'], edge['node2'], edge['tstart'], edge['tend']) for edge in data.data['edges'].values()
+        )
+        # for each node in data['nodes'].
         for index, node in data.data['nodes'].items():
             # add the node using the add_node method.
             self.add_node(node)
@@ -272,9 +426,64 @@ class TemporalGraph(Graph):
             edge : TemporalEdge
                 The corresponding edge object.
         """
+        self.modified()
         return self.edges.add(node1, node2, self.nodes, tstart, tend)
 
 
+    def add_edges_from(self, edges):
+        """
+            A method of TemporalGraph.
+
+            Parameter(s):
+            -------------
+            edges : Iterable
+                An iterable of (node1, node2, tstart) or (node1, node2, tstart, tend) tuples.
+
+            Returns:
+            --------
+                None, adds the edges (and any new nodes) to the graph in a single pass.
+                Duplicate edges are dropped and the edges are sorted once.
+        """
+        self.modified()
+        self.edges.add_from(
+            ((edge[0], edge[1], edge[2], edge[3] if len(edge) > 3 else None) for edge in edges), self.nodes
+        )
+
+
+    @classmethod
+    def from_arrays(cls, label, node1, node2, tstart, tend=None, columnar=False):
+        """
+            A class method of TemporalGraph.
+
+            Parameter(s):
+            -------------
+            label : String
+                A label for the graph.
+            node1 : List/Array
+                The node1 labels of the edges.
+            node2 : List/Array
+                The node2 labels of the edges.
+            tstart : List/Array
+                The start times of the edges.
+            tend : List/Array
+                The end times of the edges. Defaults to the start times (duration of 0).
+            columnar : Boolean
+                Store the edges as numpy columns, the arrays are then loaded without a per-edge loop.
+
+            Returns:
+            --------
+            graph : TemporalGraph
+                A temporal graph of this class, built with a single bulk insert.
+
+            Example(s):
+            -----------
+                graph = TemporalDiGraph.from_arrays('test_network', sources, sinks, starts, ends)
+        """
+        graph = cls(label, columnar=columnar)
+        graph.edges.add_arrays(node1, node2, tstart, tend, graph.nodes)
+        return graph
+
+
     def get_snapshot(self, time):
         """
             A method of TemporalGraph.
@@ -305,6 +514,69 @@ class TemporalGraph(Graph):
         return graph
 
 
+    def snapshots(self, start=None, end=None, step=1):
+        """
+            A method of TemporalGraph.
+
+            Parameter(s):
+            -------------
+            start : Integer
+                The time of the first snapshot, defaults to the graph's start time.
+            end : Integer
+                The time of the last snapshot, defaults to the graph's end time.
+            step : Integer
+                The time between consecutive snapshots.
+
+            Returns:
+            --------
+            snapshots : Generator
+                Yields (time, graph) pairs, where graph is the static snapshot at 'time' (as from get_snapshot).
+                The same graph object is updated in place between steps, it should be copied if it is kept.
+
+            Notes:
+            ------
+            The time-ordered edge stream is swept once, edges are added to the snapshot as they start and
+            removed after they end. A sequence of snapshots costs O(M log M + N) plus the changes between steps,
+            rather than O(M + N) for every step.
+        """
+        alist = self.edges.set
+        # without edges there are no default start & end times.
+        if not alist and (start is None or end is None):
+            return
+        start = self.edges.start() if start is None else start
+        end = self.edges.end() if end is None else end
+        by_end = sorted(alist, key=lambda edge: edge.end)
+        # the snapshot keeps every node, only its edges change.
+        graph = self._staticclass(self.label)
+        for node in self.nodes.set:
+            graph.add_node(node.label)
+        active = dict() # static edge label -> number of active temporal edges with that label.
+        i, j = 0, 0
+        for time in range(start, end + 1, step):
+            changed = dict() # static edge label -> a temporal edge with that label.
+            # edges starting at or before 'time' become active.
+            while i < len(alist) and alist[i].start <= time:
+                edge = alist[i]
+                active[edge.label] = active.get(edge.label, 0) + 1
+                changed[edge.label] = edge
+                i += 1
+            # edges ending before 'time' are no longer active (they have all been counted in above).
+            while j < len(by_end) and by_end[j].end < time:
+                edge = by_end[j]
+                active[edge.label] -= 1
+                changed[edge.label] = edge
+                j += 1
+            # apply the net change of each static edge to the snapshot.
+            for label, edge in changed.items():
+                if active[label] and not graph.edges.exists(label):
+                    graph.add_edge(edge.node1.label, edge.node2.label)
+                elif not active[label]:
+                    del active[label]
+                    graph.remove_edges((label,))
+            graph.label = self.label + ' [time: ' + str(time) + ']'
+            yield time, graph
+
+
     def get_underlying_graph(self):
         """
             A method of TemporalGraph.
@@ -312,16 +584,32 @@ class TemporalGraph(Graph):
             Returns:
             --------
             graph : Graph
-                A static undirected graph.
+                A static undirected graph, with an edge for each pair of nodes connected at any time.
+
+            Notes:
+            ------
+            The graph is built once per version of this graph (see Graph.cached) and shared between calls,
+            it should be copied before it is modified. See get_contacts for the number & times of each
+            pair's contacts.
+        """
+        return self.cached('underlying_graph', self.build_underlying_graph)
+
+
+    def build_underlying_graph(self):
+        """
+            A method of TemporalGraph.
+
+            Returns:
+            --------
+            graph : Graph
+                A new static graph (of the graph's static class), see get_underlying_graph.
         """
         # update the graph label.
         label = self.label + ' [underlying graph]'
         # create a static graph.
         graph = self._staticclass(label)
-        # for each edge in the original graph.
-        for edge in self.edges.set:
-            # add the edge to the snapshot.
-            graph.add_edge(edge.node1.label, edge.node2.label)
+        # add one edge per connected pair, in the order of the pairs' first contacts.
+        graph.add_edges_from((contact['node1'], contact['node2']) for contact in self.get_contacts().values())
         # for each node in the graph.
         for node in self.nodes.set:
             # add the node to the snapshot.
@@ -330,6 +618,51 @@ class TemporalGraph(Graph):
         return graph
 
 
+    def get_contacts(self):
+        """
+            A method of TemporalGraph.
+
+            Returns:
+            --------
+            contacts : Dict
+                Maps the label of each static edge (for example 'a-b') to a dictionary of its contacts:
+                'node1' & 'node2' (node labels), 'count' (the number of temporal edges between the pair),
+                'first' (the earliest start time), 'last' (the latest end time)
+                and 'duration' (the total duration of the temporal edges).
+
+            Notes:
+            ------
+            The contacts are counted in one pass over the edges and kept until the graph changes,
+            like get_underlying_graph the result is shared between calls and should not be modified.
+        """
+        return self.cached('contacts', self.count_contacts)
+
+
+    def count_contacts(self):
+        """
+            A method of TemporalGraph.
+
+            Returns:
+            --------
+            contacts : Dict
+                A new dictionary of the contacts of each static edge, see get_contacts.
+        """
+        contacts = dict()
+        for edge in self.edges.set:
+            contact = contacts.get(edge.label)
+            if contact is None:
+                # edges are in start time order, so the first edge of a pair holds its first contact.
+                contacts[edge.label] = {
+                    'node1': edge.node1.label, 'node2': edge.node2.label,
+                    'count': 1, 'first': edge.start, 'last': edge.end, 'duration': edge.end - edge.start
+                }
+            else:
+                contact['count'] += 1
+                contact['last'] = max(contact['last'], edge.end)
+                contact['duration'] += edge.end - edge.start
+        return contacts
+
+
     def get_temporal_subgraph(self, intervals=None, nodes=None):
         """
             A method of TemporalGraph.
@@ -353,29 +686,25 @@ class TemporalGraph(Graph):
 
         # nodes
         if nodes:
+            # node labels that don't exist in the graph are skipped ('nodes' itself is not changed).
+            nodes = [node for node in nodes if self.nodes.exists(node)]
+            keep = set(nodes)
             for node in nodes:
-                if self.nodes.exists(node):
-                    # add the node to the subgraph.
-                    graph.add_node(node)
-                    # get the corresponding node object from the graph.
-                    nodeobj = self.nodes.get(node)
-                    # get all the edges of which this node is a 'node1of'.
-                    node1_edges = nodeobj.node1of()
-                    # for each edge, check if the 'node2' connection label is in 'nodes'.
-                    for edge in node1_edges.set:
-                        if edge.node2.label in nodes:
-                            # if it is, add the edge to the subgraph.
-                            graph.add_edge(node, edge.node2.label, edge.start, edge.end)
-                else:
-                    # node label doesn't exist in the graph, remove it.
-                    nodes.remove(node)
-            
+                # add the node to the subgraph.
+                graph.add_node(node)
+            # the edges between the nodes, from each node's adjacency list, in start time order.
+            alist = [
+                edge for node in dict.fromkeys(nodes)
+                for edge in self.edges.incident(node, 'node1') if edge.node2.label in keep
+            ]
+            alist.sort(key=lambda edge: edge.start)
             # update graph label.
             graph.label = graph.label + ' [nodes; ' + ":".join(nodes) + ']'
         else:
             for node in self.nodes.set:
                 # add the node to the subgraph.
                 graph.add_node(node.label)
+            alist = None
 
         # intervals
         if intervals:
@@ -383,24 +712,57 @@ class TemporalGraph(Graph):
                 intervals = (intervals,)
             # update graph label.
             graph.label = graph.label + ' [interval(s); ' + str(intervals) + ']'
-            if nodes:
-                # deep copy the current subgraph edges to a variable.
-                graph_edges = copy.deepcopy(graph.edges)
-                # reset the subgraph's edges.
-                graph.edges.set = []
-            else:
-                # nodes was not specified, use the original graph's edges.
-                graph_edges = self.edges
-            
+            selected = []
             for interval in intervals:
-                # get the edges collection whose duration is within 'interval'.
-                edges = graph_edges.get_edge_by_interval(interval)
-                for edge in edges.set:
-                    graph.add_edge(edge.node1.label, edge.node2.label, edge.start, edge.end)
-        else:
-            for edge in self.edges.set:
-                # add the edge to the subgraph.
-                graph.add_edge(edge.node1.label, edge.node2.label, edge.start, edge.end)
+                if alist is None:
+                    # nodes was not specified, use the original graph's interval index.
+                    selected.extend(self.edges.get_edge_by_interval(interval).set)
+                else:
+                    # keep the edges (between the nodes) whose duration is within 'interval'.
+                    selected.extend(edge for edge in alist if interval[0] <= edge.start and edge.end <= interval[1])
+            alist = selected
+        elif alist is None:
+            alist = self.edges.set
+
+        # add the selected edges in one pass, repeats (from overlapping intervals) are dropped.
+        graph.add_edges_from((edge.node1.label, edge.node2.label, edge.start, edge.end) for edge in alist)
 
         # return the created subgraph.
         return graph
+
+
+    def copy(self, cow=True):
+        """
+            A method of TemporalGraph.
+
+            Parameter(s):
+            -------------
+            cow : Boolean
+                Share the edge storage with the original graph until either graph changes (copy-on-write).
+
+            Returns:
+            --------
+            graph : TemporalGraph
+                A copy of the graph whose nodes & edges can be added or removed without changing the original.
+
+            Notes:
+            ------
+            Unlike copy.deepcopy the edges are not copied here: the copy shares the original's edge list until its
+            edges are first used, then makes its own edge objects joining its own nodes (see TemporalEdges.clone).
+            Copying a graph with N nodes costs O(N), the O(M) edge copies are only made if the copy is used.
+        """
+        graph = self.__class__.__new__(self.__class__)
+        graph.__dict__.update(self.__dict__)
+        graph._cache = dict()
+        # the copy keeps the original's node ids, so id-indexed results match between the two graphs.
+        graph.ids = NodeIds()
+        graph.ids.ids, graph.ids.labels = dict(self.ids.ids), list(self.ids.labels)
+        graph.nodes = self.nodes.__class__(graph)
+        for node in self.nodes.set:
+            node = copy.copy(node)
+            node.graph, node.data = graph, dict(node.data)
+            graph.nodes.insert(node)
+        graph.edges = self.edges.clone(graph)
+        if not cow:
+            graph.edges.compact()
+        return graph
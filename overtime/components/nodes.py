@@ -1,9 +1,96 @@
 
 import math
+import numpy as np
 import pandas as pd
 
 
 
+class NodeIds:
+    """
+        A class to represent a table of dense integer ids for the node labels of a graph.
+
+        Object Propertie(s):
+        --------------------
+        ids : Dictionary
+            Node label -> integer id.
+        labels : List
+            Integer id -> node label.
+
+        Notes:
+        ------
+        Ids are handed out in order of first use and never reused, so a removed node keeps its id and the table
+        may hold more labels than the graph has nodes. Algorithms can index lists or arrays of size count() by id,
+        mapping ids back to labels only for their results.
+
+        See also:
+        ---------
+            Node
+            Nodes
+    """
+
+    def __init__(self):
+        self.ids = dict()
+        self.labels = []
+
+
+    def intern(self, label):
+        """
+            A method of NodeIds.
+
+            Parameter(s):
+            -------------
+            label : String
+                The label of a node.
+
+            Returns:
+            --------
+            id : Integer
+                The id of the label, a new id is given to labels not yet in the table.
+        """
+        nid = self.ids.get(label)
+        if nid is None:
+            nid = self.ids[label] = len(self.labels)
+            self.labels.append(label)
+        return nid
+
+
+    def get(self, label, default=None):
+        """
+            A method of NodeIds.
+
+            Returns:
+            --------
+            id : Integer
+                The id of the label, or 'default' if it is not in the table.
+        """
+        return self.ids.get(label, default)
+
+
+    def label(self, nid):
+        """
+            A method of NodeIds.
+
+            Returns:
+            --------
+            label : String
+                The label with id 'nid'.
+        """
+        return self.labels[nid]
+
+
+    def count(self):
+        """
+            A method of NodeIds.
+
+            Returns:
+            --------
+            count : Integer
+                The number of ids handed out.
+        """
+        return len(self.labels)
+
+
+
 class Node:
     """
         A class to represent a node on a graph.
@@ -21,6 +108,8 @@ class Node:
             The label of the node.
         graph : Graph
             The graph of which the node belongs to.
+        id : Integer
+            The integer id of the node in the graph's id table (graph.ids).
         data : Dictionary
             A dictionary to be used for adding ambiguous data to a node.
 
@@ -29,11 +118,14 @@ class Node:
             ForemostNode
             Nodes
             ForemostNodes
+            NodeIds
     """
+    __slots__ = ('label', 'graph', 'id', 'data')
 
     def __init__(self, label, graph):
         self.label = str(label)
         self.graph = graph
+        self.id = graph.ids.intern(self.label)
         self.data = dict()
 
 
@@ -65,13 +157,10 @@ class Node:
         """
         # if a time was specified.
         if time is not None:
-            # get all graph edges that are active at this time.
-            edges = self.graph.edges.get_active_edges(time)
-        else:
-            # no time was specified, get all the graph's edges.
-            edges = self.graph.edges
+            # get this node's edges that are active at this time (from the node's adjacency list).
+            return self.graph.edges.get_edge_by_node1(self.label, time)
         # return the edges that have this node as their 'node1' property.
-        return edges.get_edge_by_node1(self.label)
+        return self.graph.edges.get_edge_by_node1(self.label)
 
     
     def sourceof(self, time=None):
@@ -110,13 +199,10 @@ class Node:
         """
         # if time was specified.
         if time is not None:
-            # get all graph edges that are active at this time.
-            edges = self.graph.edges.get_active_edges(time)
-        else:
-            # no time was specified, get all the graph's edges.
-            edges = self.graph.edges
+            # get this node's edges that are active at this time (from the node's adjacency list).
+            return self.graph.edges.get_edge_by_node2(self.label, time)
         # return the edges that have this node as their 'node2' property.
-        return edges.get_edge_by_node2(self.label)
+        return self.graph.edges.get_edge_by_node2(self.label)
 
     
     def sinkof(self, time=None):
@@ -155,13 +241,10 @@ class Node:
         """
         # if time was specified.
         if time is not None:
-            # get all graph edges that are active at this time.
-            edges = self.graph.edges.get_active_edges(time)
-        else:
-            # no time was specified, get all the graph's edges.
-            edges = self.graph.edges
+            # get this node's edges that are active at this time (from the node's adjacency list).
+            return self.graph.edges.get_edge_by_node(self.label, time)
         # return the edges that have this node as their 'node1' or 'node2' property.
-        return edges.get_edge_by_node(self.label)
+        return self.graph.edges.get_edge_by_node(self.label)
 
 
     def neighbours(self, time=None):
@@ -215,21 +298,22 @@ class Node:
         """
         # Digraphs
         if self.graph.directed:
-            edges = self.sourceof(time)
+            # the node's adjacency list, no collection is created.
+            edges = self.graph.edges.incident(self.label, 'node1', time)
             # create a new nodes collection
             neighbours = []
             # for each edge for which the node is a source
-            for edge in edges.aslist():
+            for edge in edges:
                 neighbours.append([edge.sink.label, edge.start])
             return neighbours
 
         # Undirected graphs
         else:
-            edges = self.nodeof(time)
+            edges = self.graph.edges.incident(self.label, 'node', time)
             # create a new nodes collection.
             neighbours = []
             # for each edge connected to the node
-            for edge in edges.aslist():
+            for edge in edges:
                 if not edge.node1.label == self.label:
                     neighbours.append([edge.node1.label, edge.start])
                 if not edge.node2.label == self.label:
@@ -257,6 +341,8 @@ class ForemostNode(Node):
             Inherited from Node.
         graph : Graph
             Inherited from Node.
+        id : Integer
+            Inherited from Node.
         data : Dictionary
             Inherited from Node.
         time : Integer
@@ -268,6 +354,7 @@ class ForemostNode(Node):
             Nodes
             ForemostNodes
     """
+    __slots__ = ('time',)
 
     def __init__(self, label, graph, time=float('inf')):
         super().__init__(label, graph)
@@ -301,8 +388,13 @@ class Nodes:
         --------------------
         set : Set
             The set of nodes.
+        index : Dictionary
+            A lookup of the nodes in the collection, keyed by label.
+            Built on first use, then kept up to date as nodes are added and removed.
         graph : Graph
             The graph of which the nodes collection belongs to.
+        version : Integer
+            Incremented each time nodes are added to or removed from the collection, see Graph.cached.
 
 
         See also:
@@ -312,10 +404,20 @@ class Nodes:
             ForemostNodes
     """
     def __init__(self, graph):
-        self.set = set() # unorderd, unindexed, unique collection of node objects
+        self.version = 0 # changes with the nodes held, see Graph.cached.
+        self.set = set() # unorderd, unique collection of node objects
+        self._index = None # node label -> node object, see index.
         self.graph = graph
 
 
+    @property
+    def index(self):
+        # the label lookup is built on first use, then kept up to date by insert & remove.
+        if self._index is None:
+            self._index = {node.label: node for node in self.set}
+        return self._index
+
+
     def aslist(self):
         """
             A method of Nodes.
@@ -357,11 +459,30 @@ class Nodes:
         # check if a node with this label already exists in the graph.
         if not self.exists(str(label)):
             # if it does not, add it (create a new node object).
-            self.set.add(Node(label, self.graph))
+            self.insert(Node(label, self.graph))
         # return the node object (get or create).
         return self.get(label)
 
 
+    def insert(self, node):
+        """
+            A method of Nodes.
+
+            Parameter(s):
+            -------------
+            node : Node
+                An existing node object.
+
+            Returns:
+            --------
+                None, adds the node object to the collection and its label index.
+        """
+        self.version += 1
+        self.set.add(node)
+        if self._index is not None:
+            self._index[node.label] = node
+
+
     def remove(self, label):
         """
             A method of Nodes.
@@ -380,7 +501,8 @@ class Nodes:
         if not self.exists(str(label)):
             return False
         else:
-            self.set.remove(self.get(label))
+            self.version += 1
+            self.set.remove(self.index.pop(str(label)))
             return True
 
 
@@ -401,10 +523,8 @@ class Nodes:
         """
         # create a new nodes collection subset.
         subset = self.__class__(self.graph)
-        # for each node in the specified list.
-        for node in alist:
-            # add the node to the subset.
-            subset.set.add(node)
+        # add the nodes in one step, the subset's label lookup is only built if it is queried.
+        subset.set = set(alist)
         # return the new collection of nodes.
         return subset
 
@@ -424,7 +544,7 @@ class Nodes:
                 The node in the collection with label 'label' (if it exists).
             
         """
-        return next((node for node in self.set if node.label == label), None)
+        return self.index.get(label)
 
 
     def exists(self, label):
@@ -442,7 +562,7 @@ class Nodes:
                 True/false depending of whether node with label 'label' exists in the collection.
             
         """
-        return True if self.get(label) is not None else False
+        return label in self.index
 
     
     def count(self):
@@ -497,18 +617,49 @@ class Nodes:
             --------
                 None, adds the data in the csv data frame to each node.
                 The csv data must correspond to the nodes in the node collection.
+
+            Notes:
+            ------
+            The rows are aligned on the 'label' column once: rows for labels that are not in the collection
+            are skipped and a later row for the same label replaces an earlier one. Each aligned row is
+            copied into its node's data, the only place node attributes are kept (see get_data).
         """
         # create a data frame from the csv file.
         data_frame = pd.read_csv(csv_path)
-        # for each row in the data frame.
-        for index, row in data_frame.iterrows():
-            # if a 'label' column exists.
-            if self.exists(row['label']):
-                # get the node corresponding to that 'label'.
-                node = self.get(row['label'])
-                # for each column, add the data to this node.
-                for col in data_frame.columns:
-                    node.data[col] = row[col]
+        # node labels are strings, numeric labels in the csv are matched by their text.
+        data_frame['label'] = data_frame['label'].astype(str)
+        # keep the last row for each label of a node in the collection.
+        data_frame = data_frame[data_frame['label'].isin(list(self.index))]
+        data_frame = data_frame.drop_duplicates('label', keep='last')
+        # for each row, add the data to the corresponding node.
+        for label, row in zip(data_frame['label'].tolist(), data_frame.to_dict('records')):
+            self.index[label].data.update(row)
+
+
+    def get_data(self, key, labels=None):
+        """
+            A method of Nodes.
+
+            Parameter(s):
+            -------------
+            key : String
+                A data key of the nodes, for example a column loaded by add_data.
+            labels : List
+                The labels of the nodes to get the data of, defaults to labels().
+
+            Returns:
+            --------
+            values : numpy.ndarray
+                The nodes' values for 'key', in the order of 'labels' (NaN for nodes without a value).
+
+            Notes:
+            ------
+            The values are collected from each node's data (filled by add_data, or set directly),
+            so they are always current.
+        """
+        labels = self.labels() if labels is None else labels
+        index = self.index
+        return np.array([index[label].data.get(key, np.nan) for label in labels])
 
 
 
@@ -526,6 +677,8 @@ class ForemostNodes(Nodes):
         --------------------
         set : Set
             Inherited from Nodes.
+        index : Dictionary
+            Inherited from Nodes.
         graph : Graph
             Inherited from Nodes.
 
@@ -559,7 +712,7 @@ class ForemostNodes(Nodes):
         # check if a node with this label already exists in the graph.
         if not self.exists(str(label)):
             # if it does not, add it (create a new node object).
-            self.set.add(ForemostNode(label, self.graph, time))
+            self.insert(ForemostNode(label, self.graph, time))
         # return the node object (get or create).
         return self.get(label)
 
@@ -0,0 +1,162 @@
+import heapq
+from itertools import count
+
+from overtime.components.edges import TemporalEdges, bisect_start
+from overtime.components.arcs import TemporalArcs
+
+
+
+class StreamingTemporalEdges(TemporalEdges):
+    """
+        A class to represent a sliding window of temporal edges on a graph, for graphs fed by a stream of contacts.
+        Inherits the query methods of TemporalEdges.
+
+        The window ends at the stream's current time, the largest start time added so far (or given to advance),
+        and covers the 'window' time units before it. Edges that end before the window are evicted as the
+        current time moves on, edges may arrive out of order and are evicted at once if they are already too old.
+
+        Parameter(s):
+        -------------
+        graph : Graph
+            A valid Graph class/subclass.
+        window : Integer
+            The length of the window, in time units.
+
+        Object Propertie(s):
+        --------------------
+        graph : Graph
+            Inherited from Edges.
+        set : List
+            Inherited from TemporalEdges, the edges in the window.
+        window : Integer
+            The length of the window.
+        now : Integer
+            The stream's current time, None until an edge is added.
+
+        Notes:
+        ------
+        Appending an edge costs O(log W) for W edges in the window. A late edge (starting before the last edge
+        in the window) is placed by binary search, so the list stays in order at the cost of shifting the later
+        edges, rather than being sorted again when next read. Late edges given to add_from are appended as a
+        block and merged into the list once, when it is next read. Evicted edges are removed as a batch of
+        tombstones (see TemporalEdges.discard_from), and the edge list is compacted once the tombstones
+        outnumber the edges in the window, so a stream that is only written to holds at most about twice
+        the edges in the window.
+
+        An edge that has already expired when it arrives is evicted at once: add (and graph.add_edge) still
+        returns the new edge object, but exists(edge.uid) is False. Nodes are kept after their edges are evicted, and subsets & clones of the
+        collection are ordinary TemporalEdges collections.
+
+        See also:
+        ---------
+            TemporalEdges
+            StreamingTemporalArcs
+    """
+
+    def __init__(self, graph, window):
+        super().__init__(graph)
+        self.window = window
+        self.now = None
+        self._index = dict() # kept from the start, so appends never need to read the edge list.
+        self._expiry = [] # heap of (end, sequence, edge) for the edges added, the earliest end first.
+        self._sequence = count() # breaks ties between equal end times.
+
+
+    def insert(self, edge):
+        """
+            A method of StreamingTemporalEdges.
+
+            Parameter(s):
+            -------------
+            edge : TemporalEdge
+                An existing temporal edge object.
+
+            Returns:
+            --------
+                None, adds the edge object to the window, evicting any edges that have expired.
+        """
+        ordered = self.ordered
+        super().insert(edge)
+        if ordered and not self.ordered:
+            # a late edge is moved into place, after any edges with the same start time (as a stable sort would).
+            self._set.pop()
+            self._set.insert(bisect_start(self._set, edge.start, right=True), edge)
+            self.ordered = True
+        self.track((edge,))
+
+
+    def add_from(self, edges, nodes):
+        """
+            A method of StreamingTemporalEdges.
+
+            Parameter(s):
+            -------------
+            edges : Iterable
+                An iterable of (node1, node2, tstart, tend) tuples, tend may be None.
+            nodes : Nodes
+                A valid Nodes class/subclass.
+
+            Returns:
+            --------
+            added : List
+                The new temporal edge objects, see TemporalEdges.add_from.
+                Edges that have already expired are evicted before this returns.
+        """
+        added = super().add_from(edges, nodes)
+        self.track(added)
+        return added
+
+
+    def track(self, edges):
+        """
+            A method of StreamingTemporalEdges.
+
+            Parameter(s):
+            -------------
+            edges : List
+                Temporal edge objects just added to the collection.
+
+            Returns:
+            --------
+                None, schedules the edges for eviction and moves the current time on to their latest start time.
+        """
+        for edge in edges:
+            heapq.heappush(self._expiry, (edge.end, next(self._sequence), edge))
+        if edges:
+            self.advance(max(edge.start for edge in edges))
+
+
+    def advance(self, time):
+        """
+            A method of StreamingTemporalEdges.
+
+            Parameter(s):
+            -------------
+            time : Integer
+                The stream's current time, times earlier than the current time are ignored.
+
+            Returns:
+            --------
+                None, moves the window on to end at 'time' and evicts the edges that end before it.
+        """
+        if self.now is None or time > self.now:
+            self.now = time
+        cutoff = self.now - self.window
+        expired = []
+        while self._expiry and self._expiry[0][0] < cutoff:
+            edge = heapq.heappop(self._expiry)[2]
+            # edges removed (or replaced) since they were added are skipped.
+            if self.get_edge_by_uid(edge.uid) is edge:
+                expired.append(edge)
+        if expired:
+            self.discard_from(expired)
+            # compacting only once half the list is dead keeps the cost per evicted edge constant.
+            if 2 * len(self._dead) > len(self._set):
+                self.compact()
+
+
+
+class StreamingTemporalArcs(StreamingTemporalEdges, TemporalArcs):
+    """
+        A class which represents a sliding window of temporal arcs.
+    """
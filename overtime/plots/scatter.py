@@ -134,19 +134,15 @@ class NodeScatter(Plot):
             --------
                 None, creates ScatterPoint objects.
         """
-        i = 0
-        x,y = None,None
+        nodes = list(self.graph.nodes.set)
+        labels = [node.label for node in nodes]
+        # get the whole x & y metric columns (if specified) at once.
+        xs = self.graph.nodes.get_data(self.x, labels) if self.x else [None] * len(nodes)
+        ys = self.graph.nodes.get_data(self.y, labels) if self.y else [None] * len(nodes)
         # for each node.
-        for node in self.graph.nodes.set:
-            # if a metric was specified for x.
-            if self.x:
-                x = node.data[self.x] # update x.
-            # if a metric was specified for y.
-            if self.y:
-                y = node.data[self.y] # update y.
-            # create a scatter point object for the node.            
-            self.points.append(ScatterPoint(i, x, y, parent=node))
-            i += 1
+        for i, node in enumerate(nodes):
+            # create a scatter point object for the node.
+            self.points.append(ScatterPoint(i, xs[i], ys[i], parent=node))
 
 
     def draw(self):
@@ -187,7 +183,7 @@ class NodeScatter(Plot):
         # if there is a bubble_metric specified, size the nodes using it.
         if self.bubble_metric:
             # consolidate specified metric node data into a list (absolute values).
-            node_metrics = [abs(node.data[self.bubble_metric]) for node in self.graph.nodes.set]
+            node_metrics = abs(self.graph.nodes.get_data(self.bubble_metric, [point.parent.label for point in self.points]))
             max_m = max([0 if x == float('inf') else x for x in node_metrics]) # get the metrics list maximum.
             # create a normalized list of metrics.
             normalized_metrics = [m/max_m for m in node_metrics]
@@ -1,5 +1,4 @@
 import overtime as ot
-import copy
 import numpy as np
 from pyecharts import options as opts
 from pyecharts.charts import Graph
@@ -78,10 +77,12 @@ def echarts_Circular(graph,
 
     # initialize nodes list
     nodes = []
+    # calculate the reachability of every node in one pass
+    reachabilities = ot.calculate_all_reachabilities(graph)
     if show_node_value:
         for i in range(len(graph.nodes.aslist())):
-            # calculate reachability for each nodes
-            reachability = ot.calculate_reachability(graph, graph.nodes.labels()[i])
+            # reachability of each node
+            reachability = reachabilities[graph.nodes.labels()[i]]
             if reachability > h:
                 # nodes with reachability more than h will be assigned category 0
                 nodes.append(opts.GraphNode(name=graph.nodes.labels()[i],
@@ -94,8 +95,8 @@ def echarts_Circular(graph,
                                             value=reachability))
     else:
         for i in range(len(graph.nodes.aslist())):
-            # calculate reachability for each nodes
-            reachability = ot.calculate_reachability(graph, graph.nodes.labels()[i])
+            # reachability of each node
+            reachability = reachabilities[graph.nodes.labels()[i]]
             if reachability > h:
                 # nodes with reachability more than h will be assigned category 0
                 nodes.append(opts.GraphNode(name=graph.nodes.labels()[i],
@@ -107,46 +108,28 @@ def echarts_Circular(graph,
 
     # initialize links list
     links = []
-    # used to check duplicate edges
-    edge_list = []
+    # the (start, end) times of each unique edge label, labels in order of their first start time
+    groups = graph.edges.group_by_label()
+    # used to check duplicate edges (the node pairs seen so far)
+    edge_list = set()
     # accumulate the appearance times of each edge
-    accumulator = np.zeros(len(graph.edges.labels()))
+    accumulator = np.zeros(len(groups))
     if show_edge_value:
-        # initialize value list of edges
-        edge_value = []
-        # 1. compare all edge labels with unique edge labels to find which edges are duplicated
-        # 2. edge value of duplicate edges will be added to the same list and shown together
-        for i in range(len(graph.edges.labels())):
-            for j in range(len(graph.edges.ulabels())):
-                if graph.edges.labels()[i] == graph.edges.ulabels()[j]:
-                    if j < len(edge_value):
-                        edge_value[j].append('{start time: ' + str(graph.edges.start_times()[i]) + ', end time: ' + str(
-                            graph.edges.end_times()[i]) + '}')
-                    else:
-                        tmp_edge_value = []
-                        tmp_edge_value.append(
-                            '{start time: ' + str(graph.edges.start_times()[i]) + ', end time: ' + str(
-                                graph.edges.end_times()[i]) + '}')
-                        edge_value.append(tmp_edge_value)
-            # print the rate of progress
-            print('rate of progress: {}%'.format((i + 1) / len(graph.edges.labels()) * 100))
+        # value list of edges: the start & end times of all edges with the same label are shown together
+        edge_value = [['{start time: ' + str(start) + ', end time: ' + str(end) + '}' for start, end in times]
+                      for times in groups.values()]
 
         # check duplicate edges
         # 1. get nodes' name by spliting the edge labels
-        # 2. transform them to set and compare them with elements in 'edge_list'
+        # 2. transform them to a set and look for it in 'edge_list'
         # 3. if they are not duplicated, add them to 'edge_list'
-        for i in range(len(graph.edges.ulabels())):
-            tmp = graph.edges.ulabels()[i].split('-')
+        for i, label in enumerate(groups):
+            tmp = label.split('-')
 
-            flag = True
-            for j in np.arange(0, len(edge_list)):
-                if set(tmp) == set(edge_list[j]):
-                    accumulator[i] = 1
-                    flag = False
-                    break;
-
-            if flag:
-                edge_list.append(tmp)
+            if frozenset(tmp) in edge_list:
+                accumulator[i] = 1
+            else:
+                edge_list.add(frozenset(tmp))
 
             # add links
             # duplicate edges with different direction will be rendered based on their corresponding curvature
@@ -160,18 +143,13 @@ def echarts_Circular(graph,
                                         ))
     else:
         # check duplicate edges
-        for i in range(len(graph.edges.ulabels())):
-            tmp = graph.edges.labels()[i].split('-')
+        for i, label in enumerate(groups):
+            tmp = label.split('-')
 
-            flag = True
-            for j in np.arange(0, len(edge_list)):
-                if set(tmp) == set(edge_list[j]):
-                    accumulator[i] = 1
-                    flag = False
-                    break;
-
-            if flag:
-                edge_list.append(tmp)
+            if frozenset(tmp) in edge_list:
+                accumulator[i] = 1
+            else:
+                edge_list.add(frozenset(tmp))
 
             links.append(opts.GraphLink(source=tmp[0],
                                         target=tmp[1],
@@ -284,10 +262,12 @@ def echarts_Force(graph,
 
     # initialize nodes list
     nodes = []
+    # calculate the reachability of every node in one pass
+    reachabilities = ot.calculate_all_reachabilities(graph)
     if show_node_value:
         for i in range(len(graph.nodes.aslist())):
-            # calculate reachability for each nodes
-            reachability = ot.calculate_reachability(graph, graph.nodes.labels()[i])
+            # reachability of each node
+            reachability = reachabilities[graph.nodes.labels()[i]]
             if reachability > h:
                 # nodes with reachability more than h will be assigned category 0
                 nodes.append(opts.GraphNode(name=graph.nodes.labels()[i],
@@ -300,8 +280,8 @@ def echarts_Force(graph,
                                             value=reachability))
     else:
         for i in range(len(graph.nodes.aslist())):
-            # calculate reachability for each nodes
-            reachability = ot.calculate_reachability(graph, graph.nodes.labels()[i])
+            # reachability of each node
+            reachability = reachabilities[graph.nodes.labels()[i]]
             if reachability > h:
                 nodes.append(opts.GraphNode(name=graph.nodes.labels()[i],
                                             category=0))
@@ -310,38 +290,25 @@ def echarts_Force(graph,
                                             category=1))
                 # initialize links list
     links = []
+    # the (start, end) times of each unique edge label, labels in order of their first start time
+    groups = graph.edges.group_by_label()
     # used to check duplicate edges
     edge_list = []
     if show_edge_value:
-        # initialize value list of edges
-        edge_value = []
-        # 1. compare all edge labels with unique edge labels to find which edges are duplicated
-        # 2. edge value of duplicate edges will be added to the same list and shown together
-        for i in range(len(graph.edges.labels())):
-            for j in range(len(graph.edges.ulabels())):
-                if graph.edges.labels()[i] == graph.edges.ulabels()[j]:
-                    if j < len(edge_value):
-                        edge_value[j].append('{start time: ' + str(graph.edges.start_times()[i]) + ', end time: ' + str(
-                            graph.edges.end_times()[i]) + '}')
-                    else:
-                        tmp_edge_value = []
-                        tmp_edge_value.append(
-                            '{start time: ' + str(graph.edges.start_times()[i]) + ', end time: ' + str(
-                                graph.edges.end_times()[i]) + '}')
-                        edge_value.append(tmp_edge_value)
-            # print the rate of progress
-            print('rate of progress: {}%'.format((i + 1) / len(graph.edges.labels()) * 100))
-
-        for i in range(len(graph.edges.ulabels())):
-            tmp = graph.edges.ulabels()[i].split('-')
+        # value list of edges: the start & end times of all edges with the same label are shown together
+        edge_value = [['{start time: ' + str(start) + ', end time: ' + str(end) + '}' for start, end in times]
+                      for times in groups.values()]
+
+        for i, label in enumerate(groups):
+            tmp = label.split('-')
             links.append(opts.GraphLink(source=tmp[0],
                                         target=tmp[1],
                                         value=edge_value[i]
                                         )
                          )
     else:
-        for i in range(len(graph.edges.ulabels())):
-            tmp = graph.edges.ulabels()[i].split('-')
+        for i, label in enumerate(groups):
+            tmp = label.split('-')
             links.append(opts.GraphLink(source=tmp[0],
                                         target=tmp[1]
                                         )
@@ -473,10 +440,12 @@ def echarts_Location(graph,
 
     # initialize nodes list
     nodes = []
+    # calculate the reachability of every node in one pass
+    reachabilities = ot.calculate_all_reachabilities(graph)
     if show_node_value:
         for i in range(len(graph.nodes.aslist())):
-            # calculate reachability for each nodes
-            reachability = ot.calculate_reachability(graph, graph.nodes.labels()[i])
+            # reachability of each node
+            reachability = reachabilities[graph.nodes.labels()[i]]
             if reachability > h:
                 nodes.append(opts.GraphNode(name=graph.nodes.labels()[i],
                                             category=0,
@@ -496,8 +465,8 @@ def echarts_Location(graph,
                                             ))
     else:
         for i in range(len(graph.nodes.aslist())):
-            # calculate reachability for each nodes
-            reachability = ot.calculate_reachability(graph, graph.nodes.labels()[i])
+            # reachability of each node
+            reachability = reachabilities[graph.nodes.labels()[i]]
             if reachability > h:
                 nodes.append(opts.GraphNode(name=graph.nodes.labels()[i],
                                             category=0,
@@ -517,28 +486,15 @@ def echarts_Location(graph,
 
     # initialize links list
     links = []
+    # the (start, end) times of each unique edge label, labels in order of their first start time
+    groups = graph.edges.group_by_label()
     if show_edge_value:
-        # initialize value list of edges
-        edge_value = []
-        # 1. compare all edge labels with unique edge labels to find which edges are duplicated
-        # 2. edge value of duplicate edges will be added to the same list and shown together
-        for i in range(len(graph.edges.labels())):
-            for j in range(len(graph.edges.ulabels())):
-                if graph.edges.labels()[i] == graph.edges.ulabels()[j]:
-                    if j < len(edge_value):
-                        edge_value[j].append('{start time: ' + str(graph.edges.start_times()[i]) + ', end time: ' + str(
-                            graph.edges.end_times()[i]) + '}')
-                    else:
-                        tmp_edge_value = []
-                        tmp_edge_value.append(
-                            '{start time: ' + str(graph.edges.start_times()[i]) + ', end time: ' + str(
-                                graph.edges.end_times()[i]) + '}')
-                        edge_value.append(tmp_edge_value)
-            # print the rate of progress
-            print('rate of progress: {}%'.format((i + 1) / len(graph.edges.labels()) * 100))
-
-        for i in range(len(graph.edges.ulabels())):
-            tmp = graph.edges.ulabels()[i].split('-')
+        # value list of edges: the start & end times of all edges with the same label are shown together
+        edge_value = [['{start time: ' + str(start) + ', end time: ' + str(end) + '}' for start, end in times]
+                      for times in groups.values()]
+
+        for i, label in enumerate(groups):
+            tmp = label.split('-')
 
             links.append(opts.GraphLink(source=tmp[0],
                                         target=tmp[1],
@@ -547,8 +503,8 @@ def echarts_Location(graph,
                                         ))
 
     else:
-        for i in range(len(graph.edges.ulabels())):
-            tmp = graph.edges.ulabels()[i].split('-')
+        for i, label in enumerate(groups):
+            tmp = label.split('-')
 
             links.append(opts.GraphLink(source=tmp[0],
                                         target=tmp[1]
@@ -671,10 +627,12 @@ def echarts_Timeline(graph,
 
     # initialize nodes list
     nodes = []
+    # calculate the reachability of every node in one pass
+    reachabilities = ot.calculate_all_reachabilities(graph)
     if layout == 'none':
         for i in range(len(graph.nodes.aslist())):
-            # calculate reachability for each nodes
-            reachability = ot.calculate_reachability(graph, graph.nodes.labels()[i])
+            # reachability of each node
+            reachability = reachabilities[graph.nodes.labels()[i]]
             if reachability > h:
                 # nodes with reachability more than h will be assigned category 0
                 nodes.append(opts.GraphNode(name=graph.nodes.labels()[i],
@@ -691,8 +649,8 @@ def echarts_Timeline(graph,
                                             value=reachability))
     else:
         for i in range(len(graph.nodes.aslist())):
-            # calculate reachability for each nodes
-            reachability = ot.calculate_reachability(graph, graph.nodes.labels()[i])
+            # reachability of each node
+            reachability = reachabilities[graph.nodes.labels()[i]]
             if reachability > h:
                 # nodes with reachability more than h will be assigned category 0
                 nodes.append(opts.GraphNode(name=graph.nodes.labels()[i],
@@ -815,7 +773,7 @@ def ShowDifference(graph, algorithm, h, width='1200px', height='600px', x='', y=
     E_ = []
 
     # copy the network
-    tmpGraph = copy.deepcopy(graph)
+    tmpGraph = graph.copy()
     if algorithm == 'h':
         E_ = edgeDeletion.h_approximation(tmpGraph, h)
     elif algorithm == 'c':
@@ -1,2 +1,5 @@
 from overtime.tests.algorithms.centrality import *
-from overtime.tests.algorithms.paths import *
\ No newline at end of file
+from overtime.tests.algorithms.paths import *
+from overtime.tests.algorithms.test_foremost import *
+from overtime.tests.algorithms.test_reachability import *
+from overtime.tests.algorithms.test_edgeDeletion import *
@@ -77,3 +77,15 @@ class OptimalityTest(unittest.TestCase):
         self.assertEqual(output_a, correct_a)
         self.assertEqual(output_e, correct_e)
         self.assertEqual(output_j, correct_j)
+
+    def test_node_connections(self):
+        """
+            Tests the path functions on a node's connections network, which holds the graph's own nodes & edges.
+        """
+        connections = self.network1.get_node_connections('e')
+        correct_e = {'e': 0, 'f': 1, 'h': 1, 'a': float('inf'), 'g': float('inf')}
+
+        self.assertEqual(calculate_fastest_path_durations(connections, 'e'), correct_e)
+        self.assertEqual(calculate_shortest_path_lengths(connections, 'e'), correct_e)
+        # the original graph's node ids are left as they were.
+        self.assertEqual(calculate_fastest_path_durations(self.network1, 'a')['b'], 12)
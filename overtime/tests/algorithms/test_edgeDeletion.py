@@ -0,0 +1,53 @@
+import io
+import unittest
+from contextlib import redirect_stdout
+
+from overtime.components.digraphs import TemporalDiGraph
+from overtime.inputs import CsvInput
+from overtime.algorithms.edgeDeletion import *
+
+
+class EdgeDeletionTest(unittest.TestCase):
+    """
+        Tests functions which delete edges to bound the temporal reachability of temporal directed graphs.
+    """
+
+    def setUp(self):
+        """
+            Create a graph for use in all test methods.
+        """
+        self.network = TemporalDiGraph('test_network', CsvInput('./overtime/tests/data/temporal_network.csv'))
+        self.network.add_edge('e', 'd', 8, 9)
+        self.layout = ['a', 'b', 'c', 'd', 'e']
+
+
+    def test_max_prefix_reachability(self):
+        """
+            Tests that max_prefix_reachability matches the max reachability of the layout prefix's subgraph.
+        """
+        for j in range(len(self.layout)):
+            subgraph = self.network.get_temporal_subgraph(
+                intervals=(0, max_endtime(self.network)), nodes=self.layout[:j + 1]
+            )
+            self.assertEqual(max_reachability(subgraph), max_prefix_reachability(self.network, self.layout, j))
+        self.assertEqual([1, 1, 3, 4, 4], [max_prefix_reachability(self.network, self.layout, j) for j in range(5)])
+
+
+    def test_find_edges(self):
+        """
+            Tests that find_edges returns the edges that span the layout's split, in edge order.
+        """
+        self.assertEqual(
+            ['b-e|0-1', 'b-c|2-4', 'a-c|3-3', 'd-a|7-8'], find_edges(self.network, self.layout, 1)
+        )
+
+
+    def test_c_approximation(self):
+        """
+            Tests that c_approximation removes edges until the temporal reachability is at most h.
+        """
+        with redirect_stdout(io.StringIO()):
+            removed = c_approximation(self.network, 2, self.layout)
+        self.assertEqual(['b-e|0-1', 'b-c|2-4', 'a-c|3-3', 'd-a|7-8'], removed)
+        self.assertEqual(['a-b|1-2', 'c-d|5-6', 'e-d|8-9'], self.network.edges.uids())
+        self.assertEqual(2, max_reachability(self.network))
@@ -0,0 +1,49 @@
+import unittest
+
+from overtime.components.digraphs import TemporalDiGraph
+from overtime.inputs import CsvInput
+from overtime.algorithms.foremost import *
+
+
+class ForemostTest(unittest.TestCase):
+    """
+        Tests functions which find foremost times & trees in temporal directed graphs.
+    """
+
+    def setUp(self):
+        """
+            Create a graph for use in all test methods.
+        """
+        self.network = TemporalDiGraph('test_network', CsvInput('./overtime/tests/data/temporal_network.csv'))
+
+
+    def times(self, arrival):
+        return {node.label: arrival[node.id] for node in self.network.nodes.set}
+
+
+    def test_calculate_foremost_times(self):
+        """
+            Tests that calculate_foremost_times returns each node's foremost time & foremost edge.
+        """
+        arrival, predecessor = calculate_foremost_times(self.network, 'a')
+        self.assertEqual({'a': 0, 'b': 2, 'c': 3, 'd': 6, 'e': float('inf')}, self.times(arrival))
+        labels, sources, sinks, starts, ends = self.network.edges.columns()
+        self.assertEqual(-1, predecessor[self.network.nodes.get('a').id])
+        row = predecessor[self.network.nodes.get('c').id]
+        self.assertEqual(('a', 'c', 3, 3), (labels[sources[row]], labels[sinks[row]], starts[row], ends[row]))
+        # the last edge ends at the end of the graph's timespan, so it is not used.
+        arrival, predecessor = calculate_foremost_times(self.network, 'b')
+        self.assertEqual({'a': float('inf'), 'b': 0, 'c': 4, 'd': 6, 'e': 1}, self.times(arrival))
+        self.assertIsNone(calculate_foremost_times(self.network, 'x'))
+
+
+    def test_calculate_foremost_tree(self):
+        """
+            Tests that calculate_foremost_tree keeps only the foremost edge into each reached node.
+        """
+        tree = calculate_foremost_tree(self.network, 'a')
+        self.assertEqual('a', tree.root.label)
+        self.assertEqual({'a': 0, 'b': 2, 'c': 3, 'd': 6, 'e': float('inf')}, {node.label: node.time for node in tree.nodes.set})
+        self.assertEqual(3, tree.nodes.get('c').data['foremost_time'])
+        self.assertEqual(['a-b|1-2', 'a-c|3-3', 'c-d|5-6'], tree.edges.uids())
+        self.assertEqual(4, tree.nodes.get_reachable().count())
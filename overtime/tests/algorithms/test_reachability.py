@@ -0,0 +1,81 @@
+import unittest
+
+from overtime.components.digraphs import TemporalDiGraph
+from overtime.inputs import CsvInput
+from overtime.algorithms.reachability import *
+
+
+class ReachabilityTest(unittest.TestCase):
+    """
+        Tests functions which find reachability in temporal directed graphs.
+    """
+
+    def setUp(self):
+        """
+            Create a graph for use in all test methods.
+        """
+        self.network = TemporalDiGraph('test_network', CsvInput('./overtime/tests/data/temporal_network.csv'))
+
+
+    def test_calculate_reachability(self):
+        """
+            Tests that calculate_reachability counts the nodes reachable from a root, and updates its data.
+        """
+        self.assertEqual(4, calculate_reachability(self.network, 'a'))
+        self.assertEqual(4, self.network.nodes.get('a').data['reachability'])
+        self.assertEqual(4, calculate_reachability(self.network, 'b'))
+        self.assertEqual(1, calculate_reachability(self.network, 'e'))
+        self.network.remove_edge('a-c|3-3')
+        self.assertEqual(4, calculate_reachability(self.network, 'a'))
+        self.network.remove_edge('a-b|1-2')
+        self.assertEqual(1, calculate_reachability(self.network, 'a'))
+        # edges added to the collection directly are seen too.
+        self.network.edges.add('a', 'b', self.network.nodes, 1, 2)
+        self.assertEqual(4, calculate_reachability(self.network, 'a'))
+
+
+    def test_calculate_all_reachabilities(self):
+        """
+            Tests that calculate_all_reachabilities matches calculate_reachability for every node, in any block size.
+        """
+        expected = {'a': 4, 'b': 4, 'c': 2, 'd': 1, 'e': 1}
+        self.assertEqual(expected, calculate_all_reachabilities(self.network, block=2))
+        self.assertEqual(expected, {node.label: node.data['reachability'] for node in self.network.nodes.set})
+        self.network.remove_edge('c-d|5-6')
+        reachabilities = calculate_all_reachabilities(self.network, update=False)
+        self.assertEqual({'a': 3, 'b': 3, 'c': 1, 'd': 1, 'e': 1}, reachabilities)
+        self.assertEqual(2, self.network.nodes.get('c').data['reachability'])
+        for label, reachability in reachabilities.items():
+            self.assertEqual(reachability, calculate_reachability(self.network, label))
+
+
+    def test_calculate_reachability_matrix(self):
+        """
+            Tests that calculate_reachability_matrix finds who can reach whom, with reachable & reached by counts.
+        """
+        labels, matrix, reachable, reached_by = calculate_reachability_matrix(self.network)
+        reaches = {labels[i]: sorted(labels[j] for j in range(len(labels)) if matrix[i, j]) for i in range(len(labels))}
+        self.assertEqual(
+            {'a': ['a', 'b', 'c', 'd'], 'b': ['b', 'c', 'd', 'e'], 'c': ['c', 'd'], 'd': ['d'], 'e': ['e']}, reaches
+        )
+        self.assertEqual({'a': 4, 'b': 4, 'c': 2, 'd': 1, 'e': 1}, reachable)
+        self.assertEqual({'a': 1, 'b': 2, 'c': 3, 'd': 4, 'e': 2}, reached_by)
+
+
+    def test_incremental_reachability(self):
+        """
+            Tests that IncrementalReachability scans again only the roots that used a removed edge.
+        """
+        reachabilities = IncrementalReachability(self.network)
+        self.assertEqual({'a': 4, 'b': 4, 'c': 2, 'd': 1, 'e': 1}, reachabilities.reachability)
+        self.assertEqual({'b'}, reachabilities.users[self.network.edges.get_edge_by_uid('b-e|0-1')])
+        self.assertEqual(4, reachabilities.maximum())
+        reachabilities.remove_edges(['b-e|0-1'])
+        self.assertFalse(self.network.edges.exists('b-e|0-1'))
+        self.assertEqual({'a': 4, 'b': 3, 'c': 2, 'd': 1, 'e': 1}, reachabilities.reachability)
+        self.assertEqual('a', reachabilities.first_above(3))
+        reachabilities.remove_edges(['a-b|1-2', 'a-c|3-3'])
+        self.assertEqual(1, self.network.nodes.get('a').data['reachability'])
+        self.assertIsNone(reachabilities.first_above(3))
+        self.assertEqual(3, reachabilities.maximum())
+        self.assertEqual(calculate_all_reachabilities(self.network), reachabilities.reachability)
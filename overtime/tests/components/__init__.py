@@ -1,2 +1,3 @@
 from overtime.tests.components.graphs_test import *
 from overtime.tests.components.nodes_test import *
+from overtime.tests.components.columnar_test import *
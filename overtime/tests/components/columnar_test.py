@@ -0,0 +1,82 @@
+import unittest
+
+from overtime.components import TemporalGraph, TemporalDiGraph
+
+
+
+class ColumnarTemporalEdgesTest(unittest.TestCase):
+    """
+        Tests for the ColumnarTemporalEdges class, checked against the default TemporalEdges collection.
+    """
+
+    def setUp(self):
+        """
+            Create a columnar and an object-backed graph with the same edges.
+        """
+        self.edges = [
+            ('a', 'e', 2, 2), ('d', 'b', 9, 9), ('a', 'c', 10, 10), ('b', 'c', 9, 9), ('d', 'c', 7, 7),
+            ('b', 'd', 6, 6), ('e', 'b', 4, 4), ('a', 'd', 7, 7), ('d', 'c', 8, 8), ('b', 'c', 10, 10),
+            ('b', 'a', 5, 5), ('d', 'e', 7, 7), ('c', 'a', 12, 12), ('a', 'c', 12, 12)
+        ]
+        self.graph = TemporalGraph('ObjectTest')
+        self.graph.add_edges_from(self.edges)
+        self.columnar = TemporalGraph('ColumnarTest', columnar=True)
+        self.columnar.add_edges_from(self.edges)
+
+
+    def test_set(self):
+        """
+            Test that materialised edges match the object-backed collection, in order and without duplicates.
+        """
+        self.assertEqual(self.graph.edges.uids(), self.columnar.edges.uids())
+        self.assertEqual(13, self.columnar.edges.count())
+
+
+    def test_queries(self):
+        """
+            Test that column-based queries match the object-backed collection.
+        """
+        self.assertEqual(self.graph.edges.get_active_edges(9).uids(), self.columnar.edges.get_active_edges(9).uids())
+        self.assertEqual(
+            self.graph.edges.get_edge_by_interval((5, 9)).uids(),
+            self.columnar.edges.get_edge_by_interval((5, 9)).uids()
+        )
+        self.assertEqual(self.graph.edges.get_edge_by_node('c').uids(), self.columnar.edges.get_edge_by_node('c').uids())
+        self.assertEqual((2, 12), (self.columnar.edges.start(), self.columnar.edges.end()))
+
+
+    def test_remove_edge(self):
+        """
+            Test that an edge can be removed from the columns.
+        """
+        self.columnar.remove_edge('b-c|9-9')
+        self.assertNotIn('b-c|9-9', self.columnar.edges.uids())
+        self.assertEqual(12, len(self.columnar.edges.starts))
+        # edges no longer (or never) in the collection are ignored.
+        self.columnar.edges.discard(self.graph.edges.get_edge_by_uid('a-e|2-2'))
+        self.columnar.edges.discard(self.graph.edges.get_edge_by_uid('a-e|2-2'))
+        self.assertEqual(11, self.columnar.edges.count())
+
+
+    def test_add_edge(self):
+        """
+            Test that the edge object returned by add_edge is the one held by the collection.
+        """
+        edge = self.columnar.add_edge('e', 'a', 3, 4)
+        self.assertIs(edge, self.columnar.edges.get_edge_by_uid('a-e|3-4'))
+        self.assertIs(edge, self.columnar.add_edge('a', 'e', 3, 4))
+        self.assertIn(edge, self.columnar.edges.get_edge_by_node('e').set)
+        self.columnar.remove_edge('a-e|3-4')
+        self.assertIsNone(self.columnar.edges.get_edge_by_uid('a-e|3-4'))
+        self.assertIsNot(edge, self.columnar.add_edge('a', 'e', 3, 4))
+
+
+    def test_from_arrays(self):
+        """
+            Test that a directed columnar graph can be built from arrays, keeping arc direction.
+        """
+        graph = TemporalDiGraph.from_arrays('ArraysTest', ['b', 'a', 'b'], ['a', 'c', 'a'], [3, 1, 3], columnar=True)
+        self.assertEqual(['a-c|1-1', 'b-a|3-3'], graph.edges.uids())
+        node_labels, node1s, node2s, starts, ends = graph.edges.columns()
+        self.assertEqual(['a', 'b'], [node_labels[i] for i in node1s])
+        self.assertEqual([1, 3], starts.tolist())
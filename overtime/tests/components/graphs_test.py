@@ -1,7 +1,7 @@
 
 import unittest
 
-from overtime.components import Graph, TemporalGraph
+from overtime.components import Graph, TemporalGraph, TemporalDiGraph
 from overtime.inputs import CsvInput
 
 
@@ -73,6 +73,46 @@ class GraphTest(unittest.TestCase):
         self.assertNotIn('c-e', self.graph.edges.uids())
 
 
+    def test_remove_edges(self):
+        """
+            Test that several edges can be removed from the graph at once, unknown labels are skipped.
+        """
+        self.graph.remove_edges(['c-e', 'a-b', 'x-y', 'c-e'])
+        self.assertEqual(['a-f', 'b-c', 'b-d', 'c-d', 'd-f', 'e-f'], sorted(self.graph.edges.uids()))
+        self.graph.remove_edges_where(lambda edge: edge.node1.label == 'b')
+        self.assertEqual(['a-f', 'c-d', 'd-f', 'e-f'], sorted(self.graph.edges.uids()))
+        # the edges of a static graph are unordered, so a list cannot be aligned with them.
+        with self.assertRaises(TypeError):
+            self.graph.remove_edges_where([True] * self.graph.edges.count())
+        self.assertEqual(4, self.graph.edges.count())
+        self.assertEqual(['c-d'], self.graph.edges.get_edge_by_node('c').uids())
+
+
+    def test_cached(self):
+        """
+            Test that cached results are kept until the graph changes.
+        """
+        calls = []
+        count = lambda: calls.append(1) or self.graph.edges.count()
+        version = self.graph.version
+        self.assertEqual(8, self.graph.cached('count', count))
+        self.assertEqual(8, self.graph.cached('count', count))
+        self.assertEqual(1, len(calls))
+        self.graph.remove_edge('a-b')
+        self.assertGreater(self.graph.version, version)
+        self.assertEqual(7, self.graph.cached('count', count))
+        self.graph.add_edge('a', 'c')
+        self.assertEqual(8, self.graph.cached('count', count))
+        self.assertEqual(3, len(calls))
+        # changes made on the collections directly also drop the cached results.
+        self.graph.edges.add('a', 'd', self.graph.nodes)
+        self.assertEqual(9, self.graph.cached('count', count))
+        self.graph.edges.discard(self.graph.edges.get_edge_by_uid('a-d'))
+        self.assertEqual(8, self.graph.cached('count', count))
+        self.assertEqual(8, self.graph.cached('count', count))
+        self.assertEqual(5, len(calls))
+
+
 
 class TemporalGraphBuildTest(unittest.TestCase):
     """
@@ -156,6 +196,138 @@ class TemporalGraphTest(unittest.TestCase):
         self.assertNotIn('a-e|2-2', self.graph.edges.uids())
 
 
+    def test_remove_edge_index(self):
+        """
+            Test that removing an edge, among others with the same start time, keeps the uid index in step.
+        """
+        self.graph.remove_edge('b-c|9-9')
+        self.assertFalse(self.graph.edges.exists('b-c|9-9'))
+        self.assertTrue(self.graph.edges.exists('b-d|9-9'))
+        self.assertEqual(sorted(self.graph.edges.uids()), sorted(self.graph.edges.index))
+        edge = self.graph.add_edge('c', 'b', 9)
+        self.assertIs(edge, self.graph.edges.get_edge_by_uid('b-c|9-9'))
+        self.assertEqual(13, self.graph.edges.count())
+
+
+    def test_remove_edges(self):
+        """
+            Test that removing several edges at once keeps the order, uid index, node lists & time bounds in step.
+        """
+        self.graph.edges.get_edge_by_node('c').uids()
+        self.graph.remove_edges(['a-c|12-12', 'b-c|9-9', 'x-y|0-0'])
+        self.assertFalse(self.graph.edges.exists('b-c|9-9'))
+        self.assertIsNone(self.graph.edges.get_edge_by_uid('a-c|12-12'))
+        self.assertEqual(['c-d|7-7', 'c-d|8-8', 'a-c|10-10', 'b-c|10-10'], self.graph.edges.get_edge_by_node('c').uids())
+        self.graph.remove_edges_where([edge.start >= 10 for edge in self.graph.edges.set])
+        self.assertEqual(9, self.graph.edges.count())
+        self.assertEqual(9, self.graph.edges.end())
+        self.assertEqual(['c-d|7-7', 'c-d|8-8'], self.graph.edges.get_edge_by_node('c').uids())
+        self.assertEqual(sorted(self.graph.edges.uids()), sorted(self.graph.edges.index))
+
+
+    def test_add_edges_from(self):
+        """
+            Test that bulk added edges match edges added one at a time, including order and deduplication.
+        """
+        graph = TemporalGraph('BulkTest')
+        graph.add_edges_from(
+            (edge.node2.label, edge.node1.label, edge.start, edge.end) for edge in reversed(self.graph.edges.set)
+        )
+        graph.add_edges_from([('a', 'e', 2), ('e', 'a', 2, 2)])
+        self.assertEqual(sorted(self.graph.edges.uids()), sorted(graph.edges.uids()))
+        self.assertEqual(sorted(graph.edges.start_times()), graph.edges.start_times())
+        self.assertEqual(sorted(self.graph.nodes.labels()), sorted(graph.nodes.labels()))
+
+
+    def test_from_arrays(self):
+        """
+            Test that a directed temporal graph can be built from aligned arrays.
+        """
+        graph = TemporalDiGraph.from_arrays('ArraysTest', ['b', 'a', 'b'], ['a', 'c', 'a'], [3, 1, 3], [4, 2, 4])
+        self.assertEqual(['a-c|1-2', 'b-a|3-4'], graph.edges.uids())
+        self.assertEqual(['a', 'b', 'c'], sorted(graph.nodes.labels()))
+
+
+    def test_edges_ordered(self):
+        """
+            Test that edges added out of order are read back by start time, ties kept in insertion order.
+        """
+        self.graph.add_edge('e', 'c', 1)
+        uids = self.graph.edges.uids()
+        self.assertEqual(sorted(self.graph.edges.start_times()), self.graph.edges.start_times())
+        self.assertEqual('c-e|1-1', uids[0])
+        self.assertLess(uids.index('b-d|9-9'), uids.index('b-c|9-9'))
+
+
+    def test_interval_queries(self):
+        """
+            Test the interval-indexed edge queries, including after the edges change.
+        """
+        edges = self.graph.edges
+        self.assertEqual(['b-d|9-9', 'b-c|9-9'], edges.get_active_edges(9).uids())
+        self.assertEqual(['a-c|10-10', 'b-c|10-10'], edges.get_edge_by_end(10).uids())
+        self.graph.add_edge('a', 'b', 3, 9)
+        self.assertEqual(['a-b|3-9', 'b-d|9-9', 'b-c|9-9'], edges.get_active_edges(9).uids())
+        self.assertEqual(['a-b|3-9', 'b-e|4-4'], edges.get_edge_by_overlap((4, 4)).uids())
+        self.assertEqual(['b-e|4-4', 'a-b|5-5'], edges.get_edge_by_interval((4, 5)).uids())
+
+
+    def test_node_adjacency(self):
+        """
+            Test the per-node edge lists, including after the edges change.
+        """
+        node = self.graph.nodes.get('b')
+        self.assertEqual(['b-d|9-9', 'b-c|9-9'], node.nodeof(9).uids())
+        self.assertEqual([['d', 9], ['c', 9]], node.temporal_neighbours(9))
+        self.graph.add_edge('a', 'b', 3, 9)
+        self.graph.remove_edge('b-d|9-9')
+        self.assertEqual(['a-b|3-9', 'b-c|9-9'], node.nodeof(9).uids())
+        self.assertEqual(['a-b|3-9'], node.node2of(9).uids())
+        self.assertEqual([['a', 3], ['c', 9]], node.temporal_neighbours(9))
+
+
+    def test_query_views(self):
+        """
+            Test that chained edge queries hold the parent's edges as they were when the query was made.
+        """
+        edges = self.graph.edges
+        view = edges.get_edge_by_node('b').get_edge_by_overlap((4, 9)).get_active_edges(9)
+        later = edges.get_edge_by_node('b').get_active_edges(9)
+        self.graph.add_edge('a', 'b', 3, 9)
+        self.graph.remove_edge('b-c|9-9')
+        self.assertEqual(['b-d|9-9', 'b-c|9-9'], view.uids())
+        self.assertEqual(['b-d|9-9', 'b-c|9-9'], [edge.uid for edge in later.set])
+        self.assertEqual(['a-b|3-9', 'b-d|9-9'], edges.get_edge_by_node('b').get_active_edges(9).uids())
+        view.add('b', 'e', edges.graph.nodes, 9)
+        self.assertEqual(3, view.count())
+        self.assertEqual(13, edges.count())
+
+
+    def test_edge_attributes(self):
+        """
+            Test the computed edge attributes of a slotted temporal edge.
+        """
+        edge = self.graph.add_edge('b', 'a', 3.0, 7)
+        self.assertEqual(('a-b', 'a-b|3-7', 4, False), (edge.label, edge.uid, edge.duration, edge.directed))
+        self.assertIs(edge, self.graph.edges.get_edge_by_uid('a-b|3-7'))
+        self.assertFalse(hasattr(edge, '__dict__'))
+        arc = TemporalDiGraph('DiGraph').add_edge('b', 'a', 3, 7)
+        self.assertEqual(('b-a|3-7', 'b', 'a', True), (arc.uid, arc.source.label, arc.sink.label, arc.directed))
+
+
+    def test_time_bounds(self):
+        """
+            Test the start & end times of the edges as edges are added and removed.
+        """
+        edges = self.graph.edges
+        self.assertEqual((2, 12), (edges.start(), edges.end()))
+        self.graph.add_edge('a', 'b', 1, 14)
+        self.assertEqual((1, 14), (edges.start(), edges.end()))
+        self.assertEqual(range(1, 14), edges.timespan())
+        self.graph.remove_edge('a-b|1-14')
+        self.assertEqual((2, 12), (edges.start(), edges.end()))
+
+
     def test_get_snapshot(self):
         """
             Test getting a snapshot of the temporal graph.
@@ -167,6 +339,18 @@ class TemporalGraphTest(unittest.TestCase):
         )
 
 
+    def test_snapshots(self):
+        """
+            Test that the snapshot sequence matches the individual snapshots of the temporal graph.
+        """
+        times = []
+        for time, snapshot in self.graph.snapshots(step=2):
+            times.append(time)
+            self.assertEqual(sorted(self.graph.get_snapshot(time).edges.labels()), sorted(snapshot.edges.labels()))
+            self.assertEqual(5, snapshot.nodes.count())
+        self.assertEqual([2, 4, 6, 8, 10, 12], times)
+
+
     def test_get_underlying_graph(self):
         """
             Test getting the underlying graph of the temporal graph.
@@ -178,6 +362,38 @@ class TemporalGraphTest(unittest.TestCase):
         )
 
 
+    def test_get_contacts(self):
+        """
+            Test the contact counts & times of each connected pair, and that they are kept until the graph changes.
+        """
+        contacts = self.graph.get_contacts()
+        self.assertEqual(
+            {'node1': 'b', 'node2': 'c', 'count': 2, 'first': 9, 'last': 10, 'duration': 0}, contacts['b-c']
+        )
+        self.assertEqual(2, contacts['a-c']['count'])
+        self.assertIs(self.graph.get_underlying_graph(), self.graph.get_underlying_graph())
+        self.graph.add_edge('b', 'c', 11, 14)
+        self.assertEqual(3, self.graph.get_contacts()['b-c']['count'])
+        self.assertEqual(14, self.graph.get_contacts()['b-c']['last'])
+        self.assertEqual(3, self.graph.get_contacts()['b-c']['duration'])
+
+
+    def test_group_by_label(self):
+        """
+            Test the unique edge labels & their times, including after edges are added and removed.
+        """
+        self.assertEqual(
+            ['a-e', 'b-e', 'a-b', 'b-d', 'c-d', 'a-d', 'd-e', 'b-c', 'a-c'], self.graph.edges.ulabels()
+        )
+        self.assertEqual([(9, 9), (10, 10)], self.graph.edges.group_by_label()['b-c'])
+        self.graph.add_edge('b', 'c', 13)
+        self.graph.add_edge('a', 'f', 1)
+        self.assertEqual([(9, 9), (10, 10), (13, 13)], self.graph.edges.group_by_label()['b-c'])
+        self.assertEqual(['a-f', 'a-e'], self.graph.edges.ulabels()[:2])
+        self.graph.remove_edge('a-e|2-2')
+        self.assertEqual(['a-f', 'b-e'], self.graph.edges.ulabels()[:2])
+
+
     def test_get_temporal_subgraph(self):
         """
             Test getting a temporal subgraph of the temporal graph.
@@ -187,3 +403,89 @@ class TemporalGraphTest(unittest.TestCase):
             ['c-d|7-7', 'c-d|8-8', 'b-d|9-9', 'b-c|9-9', 'b-c|10-10'],
             subgraph.edges.uids()
         )
+
+
+    def test_get_temporal_subgraph_nodes(self):
+        """
+            Test that a temporal subgraph of some nodes skips unknown labels and keeps the caller's list.
+        """
+        nodes = ['d', 'x', 'b', 'c']
+        subgraph = self.graph.get_temporal_subgraph(nodes=nodes)
+        self.assertEqual(['d', 'x', 'b', 'c'], nodes)
+        self.assertEqual(['b', 'c', 'd'], sorted(subgraph.nodes.labels()))
+        self.assertEqual(
+            ['b-d|6-6', 'c-d|7-7', 'c-d|8-8', 'b-d|9-9', 'b-c|9-9', 'b-c|10-10'],
+            subgraph.edges.uids()
+        )
+
+
+    def test_copy(self):
+        """
+            Test that removing edges from a copy and from the original leaves the other graph intact.
+        """
+        copied = self.graph.copy()
+        uids = self.graph.edges.uids()
+        self.assertEqual(uids, copied.edges.uids())
+        self.assertTrue(all(node.graph is copied for node in copied.nodes.set))
+        copied.remove_edge('a-e|2-2')
+        self.graph.remove_edge('b-c|9-9')
+        self.assertFalse(copied.edges.exists('a-e|2-2'))
+        self.assertTrue(copied.edges.exists('b-c|9-9'))
+        self.assertTrue(self.graph.edges.exists('a-e|2-2'))
+        self.assertFalse(self.graph.edges.exists('b-c|9-9'))
+        self.assertEqual([uid for uid in uids if uid != 'a-e|2-2'], copied.edges.uids())
+        self.assertEqual([uid for uid in uids if uid != 'b-c|9-9'], self.graph.edges.uids())
+
+
+    def test_copy_isolated(self):
+        """
+            Test that a copy's edges join the copy's nodes, so node data changed through them stays in the copy.
+        """
+        copied = self.graph.copy()
+        edge = copied.edges.get_edge_by_uid('a-e|2-2')
+        self.assertIs(copied, edge.graph)
+        self.assertIs(copied.nodes.get('a'), edge.node1)
+        self.assertIs(copied, edge.node1.graph)
+        edge.node1.data['colour'] = 'red'
+        self.assertEqual('red', copied.nodes.get('a').data['colour'])
+        self.assertNotIn('colour', self.graph.nodes.get('a').data)
+        self.assertNotIn('colour', self.graph.edges.get_edge_by_uid('a-e|2-2').node1.data)
+        self.assertTrue(all(edge.node1.graph is self.graph for edge in self.graph.edges.set))
+
+
+    def test_window(self):
+        """
+            Test that a windowed temporal graph evicts edges that end before the window, in or out of order.
+        """
+        graph = TemporalGraph('window', window=3)
+        graph.add_edge('a', 'b', 0, 1)
+        graph.add_edges_from([('b', 'c', 2, 2), ('c', 'd', 3, 5)])
+        self.assertEqual(['a-b|0-1', 'b-c|2-2', 'c-d|3-5'], graph.edges.uids())
+        graph.add_edge('a', 'd', 5, 5)
+        self.assertEqual(5, graph.edges.now)
+        self.assertEqual(['b-c|2-2', 'c-d|3-5', 'a-d|5-5'], graph.edges.uids())
+        edge = graph.add_edge('a', 'c', 1, 1) # late, and already outside the window.
+        self.assertEqual('a-c|1-1', edge.uid)
+        self.assertFalse(graph.edges.exists(edge.uid))
+        graph.add_edge('b', 'd', 4, 4) # late, but inside the window.
+        self.assertTrue(graph.edges.ordered) # placed in order, the list is not sorted again when read.
+        self.assertEqual(['b-c|2-2', 'c-d|3-5', 'b-d|4-4', 'a-d|5-5'], graph.edges.uids())
+        added = graph.edges.add_from([('a', 'c', 1, 1), ('d', 'b', 3, 3)], graph.nodes)
+        self.assertEqual(['a-c|1-1', 'b-d|3-3'], [edge.uid for edge in added])
+        self.assertEqual(['b-c|2-2', 'c-d|3-5', 'b-d|3-3', 'b-d|4-4', 'a-d|5-5'], graph.edges.uids())
+        self.assertEqual(['c-d|3-5', 'b-d|4-4'], graph.edges.get_edge_by_node('d', 4).uids())
+        graph.edges.advance(8)
+        self.assertEqual(['c-d|3-5', 'a-d|5-5'], graph.edges.uids())
+        self.assertEqual(['a', 'b', 'c', 'd'], sorted(graph.nodes.labels()))
+
+
+    def test_window_unread(self):
+        """
+            Test that a windowed temporal graph that is only written to does not keep its evicted edges.
+        """
+        graph = TemporalGraph('window', window=10)
+        for time in range(10000):
+            graph.add_edge('a', 'b', time)
+            graph.add_edge('b', 'c', time - 5) # late, but inside the window.
+            self.assertLessEqual(len(graph.edges._set), 50)
+        self.assertEqual(17, graph.edges.count())
@@ -1,5 +1,6 @@
 
 import unittest
+import numpy as np
 
 from overtime.components import Graph, Node, Nodes
 
@@ -159,6 +160,32 @@ class NodesTest(unittest.TestCase):
         self.assertTrue(self.nodes.exists('d'))
 
 
+    def test_insert(self):
+        """
+            Test that an existing node object can be inserted and looked up by label.
+        """
+        subset = self.nodes.subset([])
+        node = self.nodes.get('e')
+        subset.insert(node)
+        self.assertIs(node, subset.get('e'))
+        self.assertTrue(subset.remove('e'))
+        self.assertFalse(subset.exists('e'))
+        self.assertEqual(0, len(subset.index))
+
+
+    def test_ids(self):
+        """
+            Test that nodes get dense integer ids which map back to their labels.
+        """
+        ids = self.nodes.graph.ids
+        self.assertEqual([0, 1, 2, 3, 4, 5], sorted(node.id for node in self.nodes.set))
+        self.assertEqual('e', ids.label(self.nodes.get('e').id))
+        self.nodes.remove('e')
+        self.assertEqual(6, self.nodes.graph.add_node('g').id)
+        self.assertEqual(7, ids.count())
+        self.assertIsNone(ids.get('h'))
+
+
     def test_counts(self):
         """
             Test the number of nodes can be retrieved.
@@ -174,3 +201,21 @@ class NodesTest(unittest.TestCase):
             ['a', 'b', 'c', 'd', 'e', 'f'],
             sorted(self.nodes.labels())
         )
+
+
+    def test_add_data(self):
+        """
+            Test that node data is loaded from a csv, and can be read back per node or as a column.
+        """
+        self.nodes.add_data('./overtime/tests/data/nodes.csv')
+        self.assertEqual({'label': 'a', 'x': 3, 'y': 2.5}, self.nodes.get('a').data)
+        self.assertEqual({}, self.nodes.get('c').data)
+        self.assertEqual([3, 2], list(self.nodes.get_data('x', ['a', 'b'])))
+        self.assertEqual(2, np.isnan(self.nodes.get_data('y', ['c', 'b', 'd'])).sum())
+        self.nodes.get('c').data['degree'] = 4
+        self.nodes.get('c').data['x'] = 5
+        self.assertEqual(4, self.nodes.get_data('degree', ['c', 'a'])[0])
+        self.assertEqual([5, 3], list(self.nodes.get_data('x', ['c', 'a'])))
+        # values loaded from the csv & changed on a node afterwards are read as changed.
+        self.nodes.get('a').data['x'] = 7
+        self.assertEqual([7, 2], list(self.nodes.get_data('x', ['a', 'b'])))